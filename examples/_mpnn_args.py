@@ -0,0 +1,92 @@
+"""
+Default argument set shared by the example use case scripts.
+
+run.main / score.main read their options from an argparse-style namespace.
+DEFAULT_ARGS holds every option the examples pass, with the values the repo
+CLI would use; each use case only overrides the handful it exposes.
+"""
+
+from types import SimpleNamespace
+
+MODEL_PARAMS_DIR = "./repo/LigandMPNN/model_params"
+
+DEFAULT_ARGS = {
+    "seed": 111,
+    "pdb_path": "",
+    "out_folder": "",
+    "temperature": 0.1,
+    "model_type": "protein_mpnn",
+    "batch_size": 1,
+    "number_of_batches": 1,
+    "verbose": 1,
+    "save_stats": 0,
+    "use_cuda_graphs": 0,
+    # Model checkpoints
+    "checkpoint_protein_mpnn": f"{MODEL_PARAMS_DIR}/proteinmpnn_v_48_020.pt",
+    "checkpoint_ligand_mpnn": f"{MODEL_PARAMS_DIR}/ligandmpnn_v_32_020_25.pt",
+    "checkpoint_soluble_mpnn": f"{MODEL_PARAMS_DIR}/solublempnn_v_48_020.pt",
+    "checkpoint_global_label_membrane_mpnn": f"{MODEL_PARAMS_DIR}/global_label_membrane_mpnn_v_48_020.pt",
+    "checkpoint_per_residue_label_membrane_mpnn": f"{MODEL_PARAMS_DIR}/per_residue_label_membrane_mpnn_v_48_020.pt",
+    "checkpoint_path_sc": f"{MODEL_PARAMS_DIR}/ligandmpnn_sc_v_32_002_16.pt",
+    # Design constraints
+    "fixed_residues": "",
+    "redesigned_residues": "",
+    "omit_AA": "",
+    "bias_AA": "",
+    "chains_to_design": "",
+    "parse_these_chains_only": "",
+    "bias_AA_per_residue": "",
+    "omit_AA_per_residue": "",
+    "symmetry_residues": "",
+    "symmetry_weights": "",
+    "homo_oligomer": 0,
+    "file_ending": "",
+    "zero_indexed": 0,
+    "ligand_mpnn_use_atom_context": 1,
+    "ligand_mpnn_use_side_chain_context": 0,
+    "ligand_mpnn_cutoff_for_score": 8.0,
+    "global_transmembrane_label": 0,
+    "transmembrane_buried": "",
+    "transmembrane_interface": "",
+    "fasta_seq_separation": ":",
+    "parse_atoms_with_zero_occupancy": 0,
+    # Multi-PDB inputs
+    "pdb_path_multi": "",
+    "fixed_residues_multi": "",
+    "redesigned_residues_multi": "",
+    "omit_AA_per_residue_multi": "",
+    "bias_AA_per_residue_multi": "",
+    # Side chain packing
+    "pack_side_chains": 0,
+    "pack_with_ligand_context": 0,
+    "repack_everything": 0,
+    "number_of_packs_per_design": 0,
+    "sc_num_denoising_steps": 3,
+    "sc_num_samples": 16,
+    "packed_suffix": "_packed",
+    "force_hetatm": 0,
+    # Scoring
+    "fasta_path": "",
+    "autoregressive_score": 0,
+    "use_sequence": 1,
+    "single_aa_score": 1,
+}
+
+
+def make_args(**overrides):
+    """
+    Build the Args namespace passed to run.main / score.main
+
+    Args:
+        **overrides: Options to set instead of their DEFAULT_ARGS value
+
+    Returns:
+        SimpleNamespace with every DEFAULT_ARGS key set
+
+    Raises:
+        TypeError: If an override is not a known option
+    """
+    unknown = overrides.keys() - DEFAULT_ARGS.keys()
+    if unknown:
+        raise TypeError(f"Unknown args: {', '.join(sorted(unknown))}")
+    return SimpleNamespace(**{**DEFAULT_ARGS, **overrides})
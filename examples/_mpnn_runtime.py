@@ -0,0 +1,596 @@
+"""
+Runtime helpers shared by the example use case scripts.
+
+These wrap the PyTorch process-level settings that apply to every call into
+the LigandMPNN repo (run.main / score.main), so each use case can enable them
+with a single call before handing its Args object to the repo.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import sys
+import threading
+from contextlib import ExitStack, contextmanager, nullcontext
+from pathlib import Path
+
+# Keep torch.compile artifacts between processes so only the first run compiles
+os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", os.path.expanduser("~/.cache/ligandmpnn/inductor"))
+
+import torch
+import torch.multiprocessing
+
+MATMUL_PRECISIONS = ("highest", "high", "medium")
+PRECISIONS = ("fp32", "bf16", "fp16", "int8")
+FEATURE_CACHE_DIR = Path(os.environ.get("LIGANDMPNN_FEATURE_CACHE",
+                                        Path.home() / ".cache" / "ligandmpnn" / "features"))
+
+_TORCH_LOAD = torch.load
+_CACHE_LOCK = threading.Lock()
+_PATCH_LOCK = threading.Lock()
+# Repo module name -> (nesting depth, ExitStack undoing its torch patch)
+_patched_modules = {}
+
+
+def configure_torch_perf(matmul_precision="high"):
+    """
+    Enable TF32 tensor cores and cuDNN autotuning for inference
+
+    Args:
+        matmul_precision: float32 matmul precision ("highest" keeps full FP32,
+            "high"/"medium" allow TF32/BF16 tensor cores on Ampere and newer)
+    """
+    if matmul_precision not in MATMUL_PRECISIONS:
+        raise ValueError(f"Unknown matmul precision: {matmul_precision}. Must be one of {MATMUL_PRECISIONS}")
+
+    allow_tf32 = matmul_precision != "highest"
+    torch.set_float32_matmul_precision(matmul_precision)
+    torch.backends.cuda.matmul.allow_tf32 = allow_tf32
+    torch.backends.cudnn.allow_tf32 = allow_tf32
+    torch.backends.cudnn.benchmark = True
+
+
+def split_batches(num_sequences, max_batch=None):
+    """
+    Split a sequence count into (batch_size, number_of_batches)
+
+    All sequences go into a single batched forward unless max_batch caps the
+    batch size. When capped, the largest batch size <= max_batch that divides
+    num_sequences evenly is used, so exactly num_sequences are generated.
+
+    Args:
+        num_sequences: Total number of sequences to generate
+        max_batch: Optional upper bound on the batch size (for limited VRAM)
+
+    Returns:
+        Tuple of (batch_size, number_of_batches)
+    """
+    if num_sequences < 1:
+        raise ValueError(f"Number of sequences must be >= 1, got: {num_sequences}")
+    if max_batch is not None and max_batch < 1:
+        raise ValueError(f"max_batch must be >= 1, got: {max_batch}")
+
+    batch_size = num_sequences if max_batch is None else min(num_sequences, max_batch)
+    while num_sequences % batch_size:
+        batch_size -= 1
+    return batch_size, num_sequences // batch_size
+
+
+# One slot per checkpoint the examples can load: five MPNN variants + the packer
+@functools.lru_cache(maxsize=6)
+def _load_checkpoint(path, mtime_ns, size, map_location):
+    try:
+        # Storages are backed by the page cache, shared across --pdb_list workers
+        return _TORCH_LOAD(path, map_location=map_location, mmap=True, weights_only=True)
+    except (TypeError, RuntimeError, pickle.UnpicklingError):
+        # torch < 2.1, legacy (non-zip) checkpoints, or non-tensor pickled objects
+        return _TORCH_LOAD(path, map_location=map_location)
+
+
+def load_checkpoint(path, map_location="cpu"):
+    """
+    Load a model checkpoint once per process and reuse it on later calls
+
+    Args:
+        path: Path to the .pt checkpoint
+        map_location: Device the checkpoint tensors are mapped to
+
+    Returns:
+        The checkpoint dict (shared between callers, do not mutate)
+    """
+    # Keyed on mtime and size as well, so a replaced checkpoint is re-read
+    st = os.stat(path)
+    with _CACHE_LOCK:
+        return _load_checkpoint(os.path.abspath(path), st.st_mtime_ns, st.st_size, str(map_location))
+
+
+def _cached_torch_load(f, map_location=None, **kwargs):
+    if isinstance(f, (str, os.PathLike)) and os.fspath(f).endswith(".pt") and not kwargs:
+        return load_checkpoint(os.fspath(f), map_location)
+    return _TORCH_LOAD(f, map_location=map_location, **kwargs)
+
+
+class _CachedLoadTorch:
+    """Stands in for torch inside one repo module; only torch.load is replaced."""
+
+    load = staticmethod(_cached_torch_load)
+
+    def __getattr__(self, name):
+        return getattr(torch, name)
+
+
+_CACHED_LOAD_TORCH = _CachedLoadTorch()
+
+
+@contextmanager
+def cached_checkpoints(module):
+    """
+    Route a repo module's torch.load calls for .pt checkpoints through load_checkpoint
+
+    run.main / score.main load their checkpoints internally on every call;
+    inside this context repeated calls share one in-memory copy per
+    (checkpoint, device) instead of re-reading it from disk. Only the
+    module's own torch name is patched, so torch.load elsewhere in the
+    process (other threads, unrelated loads) is untouched.
+
+    Args:
+        module: Repo module whose torch.load calls are cached (run or score)
+    """
+    if not hasattr(module, "torch"):
+        # Nothing to patch: the module does not load checkpoints via torch.load
+        yield
+        return
+
+    name = module.__name__
+    with _PATCH_LOCK:
+        depth, stack = _patched_modules.get(name, (0, None))
+        if depth == 0:
+            stack = ExitStack()
+            stack.enter_context(patch_attr(module, "torch", _CACHED_LOAD_TORCH))
+        _patched_modules[name] = (depth + 1, stack)
+    try:
+        yield
+    finally:
+        with _PATCH_LOCK:
+            depth, stack = _patched_modules.pop(name)
+            if depth == 1:
+                stack.close()
+            else:
+                _patched_modules[name] = (depth - 1, stack)
+
+
+@contextmanager
+def patch_attr(obj, name, value):
+    """
+    Temporarily replace an attribute of a module or object
+
+    Args:
+        obj: Module or object holding the attribute
+        name: Attribute name
+        value: Replacement value
+
+    Yields:
+        The original attribute value
+    """
+    original = getattr(obj, name)
+    setattr(obj, name, value)
+    try:
+        yield original
+    finally:
+        setattr(obj, name, original)
+
+
+def _feature_cache_path(pdb_path, args, kwargs):
+    digest = hashlib.sha1()
+    with open(pdb_path, "rb") as f:
+        digest.update(f.read())
+    digest.update(repr((args, sorted(kwargs.items()))).encode())
+    return FEATURE_CACHE_DIR / f"{digest.hexdigest()}.pt"
+
+
+def _pinned_to(obj, device):
+    if isinstance(obj, torch.Tensor):
+        return obj.pin_memory().to(device, non_blocking=True)
+    if isinstance(obj, dict):
+        return {key: _pinned_to(value, device) for key, value in obj.items()}
+    if type(obj) in (list, tuple):
+        return type(obj)(_pinned_to(value, device) for value in obj)
+    return obj
+
+
+def _load_features(cache_path, device):
+    if torch.device(device).type != "cuda":
+        return _TORCH_LOAD(cache_path, map_location=device, weights_only=False)
+    # Stage through pinned host memory so the H2D copies are asynchronous
+    return _pinned_to(_TORCH_LOAD(cache_path, map_location="cpu", weights_only=False), device)
+
+
+def cache_parsed_features(parse_fn):
+    """
+    Wrap a parse_PDB style function with an on-disk cache
+
+    Results are stored under FEATURE_CACHE_DIR, keyed on the SHA1 of the PDB
+    file contents and the parse options, so an edited PDB or different chain
+    selection is parsed again. The device is not part of the key: cached
+    tensors are mapped onto the requested device when loaded, going through
+    pinned host memory with non_blocking copies on CUDA. Cache read or write
+    failures fall back to parsing.
+
+    Args:
+        parse_fn: Function called as parse_fn(pdb_path, device=..., **options)
+
+    Returns:
+        The wrapped function
+    """
+    @functools.wraps(parse_fn)
+    def wrapper(pdb_path, device="cpu", *args, **kwargs):
+        cache_path = _feature_cache_path(pdb_path, args, kwargs)
+        if cache_path.exists():
+            try:
+                return _load_features(cache_path, device)
+            except Exception:
+                pass
+
+        features = parse_fn(pdb_path, device, *args, **kwargs)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            torch.save(features, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            pass
+        return features
+
+    return wrapper
+
+
+def cached_pdb_features(module):
+    """
+    Serve a repo module's parse_PDB calls from the on-disk feature cache
+
+    Args:
+        module: Repo module that calls parse_PDB (e.g. score)
+
+    Returns:
+        A context manager
+    """
+    return patch_attr(module, "parse_PDB", cache_parsed_features(module.parse_PDB))
+
+
+def _compile_errors():
+    """Exception types torch.compile raises lazily, on the first compiled call"""
+    try:
+        from torch._dynamo.exc import TorchDynamoException
+    except ImportError:
+        return ()
+    return (TorchDynamoException,)
+
+
+def _with_eager_fallback(model, name, compiled_fn, originals):
+    """
+    Call compiled_fn, falling back to the original methods if compiling fails
+
+    torch.compile only returns a lazy wrapper; Dynamo/Inductor/Triton errors
+    (no working Triton, an unsupported GPU or op) surface on the first call.
+    On such an error the model's original methods are restored and the call
+    is repeated eagerly.
+    """
+    @functools.wraps(originals[name])
+    def call(*args, **kwargs):
+        try:
+            return compiled_fn(*args, **kwargs)
+        except _compile_errors() as e:
+            print(f"⚠️ torch.compile failed, running uncompiled: {e}")
+            for method in originals:
+                model.__dict__.pop(method, None)
+            model._mpnn_compiled = False
+            model._mpnn_compile_failed = True
+            return originals[name](*args, **kwargs)
+
+    return call
+
+
+def compile_module(model, mode="reduce-overhead", methods=("forward", "encode", "decode")):
+    """
+    Compile a model's entry point methods in place with torch.compile
+
+    The methods are replaced on the instance (not by wrapping the module), so
+    state_dict keys, .to() and .eval() keep working on the original object.
+    If torch.compile is unavailable, or compiling fails on the first call,
+    the model runs with its original (eager) methods.
+
+    Args:
+        model: torch.nn.Module to compile
+        mode: torch.compile mode
+        methods: Method names to compile when the model defines them
+
+    Returns:
+        True if the model was compiled
+    """
+    if getattr(model, "_mpnn_compiled", False):
+        return True
+    if getattr(model, "_mpnn_compile_failed", False):
+        return False
+    if not hasattr(torch, "compile"):
+        print("⚠️ torch.compile requires PyTorch 2.0+, running uncompiled")
+        return False
+
+    originals = {name: getattr(model, name) for name in methods
+                 if callable(getattr(model, name, None))}
+    try:
+        compiled = {name: torch.compile(fn, mode=mode, fullgraph=False)
+                    for name, fn in originals.items()}
+    except Exception as e:
+        print(f"⚠️ torch.compile failed, running uncompiled: {e}")
+        return False
+    for name, fn in compiled.items():
+        setattr(model, name, _with_eager_fallback(model, name, fn, originals))
+    model._mpnn_compiled = True
+    return True
+
+
+def compiled_side_chain_packer(module):
+    """
+    Compile the side chain packer the first time a repo module packs with it
+
+    run.main builds and loads its Packer internally, so the model is compiled
+    when it is first handed to module.pack_side_chains; the denoising loop
+    then runs fused kernels for every step and sample.
+
+    Args:
+        module: Repo module that calls pack_side_chains (e.g. run)
+
+    Returns:
+        A context manager
+    """
+    pack_side_chains = module.pack_side_chains
+
+    @functools.wraps(pack_side_chains)
+    def wrapper(feature_dict, model_sc, *args, **kwargs):
+        compile_module(model_sc)
+        return pack_side_chains(feature_dict, model_sc, *args, **kwargs)
+
+    return patch_attr(module, "pack_side_chains", wrapper)
+
+
+def cuda_graph_decoder(module):
+    """
+    Run a repo module's ProteinMPNN decoder layers as replayed CUDA graphs
+
+    Autoregressive sampling calls every decoder layer once per residue with
+    same-shaped per-step tensors, so the steps are launch-bound. Models built
+    by module.ProteinMPNN inside this context get their decoder layer forwards
+    compiled with mode="reduce-overhead", which records each step as a CUDA
+    graph on first use and replays it for the remaining residues. Without
+    CUDA this is a no-op.
+
+    Args:
+        module: Repo module that constructs ProteinMPNN (e.g. run)
+
+    Returns:
+        A context manager
+    """
+    if not torch.cuda.is_available():
+        return nullcontext()
+    model_cls = module.ProteinMPNN
+
+    def build_model(*args, **kwargs):
+        model = model_cls(*args, **kwargs)
+        for layer in getattr(model, "decoder_layers", ()):
+            if not compile_module(layer, methods=("forward",)):
+                break
+        return model
+
+    return patch_attr(module, "ProteinMPNN", build_model)
+
+
+def int8_model(module):
+    """
+    Quantize ProteinMPNN models built by a repo module to int8 Linear layers
+
+    Models constructed by module.ProteinMPNN inside this context are converted
+    with torch.ao.quantization.quantize_dynamic when the repo calls .eval()
+    on them, i.e. after the checkpoint weights have been loaded. Dynamic int8
+    kernels are CPU only; models on a GPU are left in FP32 (use bf16 there).
+
+    Args:
+        module: Repo module that constructs ProteinMPNN (e.g. run, score)
+
+    Returns:
+        A context manager
+    """
+    model_cls = module.ProteinMPNN
+
+    def build_model(*args, **kwargs):
+        model = model_cls(*args, **kwargs)
+
+        def eval_and_quantize():
+            # quantize_dynamic calls model.eval() itself, so unhook first
+            del model.eval
+            model.eval()
+            if any(p.is_cuda for p in model.parameters()):
+                print("⚠️ int8 quantization is CPU only, running the GPU model in fp32")
+            else:
+                torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8,
+                                                       inplace=True)
+            return model
+
+        model.eval = eval_and_quantize
+        return model
+
+    return patch_attr(module, "ProteinMPNN", build_model)
+
+
+def warm_checkpoints(args):
+    """
+    Pre-populate the checkpoint cache for the model selected in an Args object
+
+    Args:
+        args: Args object with model_type and checkpoint_* attributes
+    """
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    paths = [getattr(args, f"checkpoint_{args.model_type}", "")]
+    if getattr(args, "pack_side_chains", 0):
+        paths.append(args.checkpoint_path_sc)
+
+    for path in paths:
+        if path and os.path.exists(path):
+            load_checkpoint(path, device)
+
+
+def warmup_kernels(args, precision="fp32", length=128, hidden_dim=128):
+    """
+    Pay the one-time start-up costs before the first real call
+
+    Loads the selected checkpoints into the cache, then creates the CUDA
+    context and cuBLAS handle and lets cuDNN/autocast pick their kernels with
+    a couple of representative (length x hidden_dim) matmuls, so the first PDB
+    is not charged for them. Call after configure_torch_perf().
+
+    Args:
+        args: Args object with model_type and checkpoint_* attributes
+        precision: Autocast precision used for the real call
+        length: Number of residues in the dummy input
+        hidden_dim: Hidden size of the dummy input (ProteinMPNN uses 128)
+    """
+    warm_checkpoints(args)
+    if not torch.cuda.is_available():
+        return
+
+    x = torch.randn(length, hidden_dim, device="cuda")
+    with torch.inference_mode(), autocast_context(precision):
+        for _ in range(2):
+            torch.nn.functional.layer_norm(torch.softmax(x @ x.T, dim=-1) @ x, (hidden_dim,))
+    torch.cuda.synchronize()
+
+
+def autocast_context(precision="fp32"):
+    """
+    Build the autocast context for a precision setting
+
+    Matmuls run in the reduced dtype on CUDA tensor cores while autocast keeps
+    softmax/layernorm/reductions in FP32. "bf16" falls back to FP16 on GPUs
+    without BF16 support; without CUDA, or for "fp32"/"int8", this is a no-op.
+
+    Args:
+        precision: One of "fp32", "bf16", "fp16", "int8"
+
+    Returns:
+        A context manager
+    """
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown precision: {precision}. Must be one of {PRECISIONS}")
+    if precision in ("fp32", "int8") or not torch.cuda.is_available():
+        return nullcontext()
+
+    if precision == "bf16" and torch.cuda.is_bf16_supported():
+        dtype = torch.bfloat16
+    else:
+        dtype = torch.float16
+    return torch.autocast(device_type="cuda", dtype=dtype)
+
+
+def run_inference(repo_main, args, precision="fp32"):
+    """
+    Call a repo entry point (run.main / score.main) with autograd disabled
+
+    torch.inference_mode() skips version counter and view tracking entirely.
+    If the repo code mutates an inference tensor in-place outside of inference
+    mode it raises; in that case the call is retried under torch.no_grad().
+    Checkpoints are served from the process-wide cache (see cached_checkpoints).
+
+    Args:
+        repo_main: The repo main function to call
+        args: Args object passed through to repo_main
+        precision: Autocast precision (see autocast_context), or "int8" to
+            quantize the model's Linear layers (see int8_model)
+    """
+    module = sys.modules[repo_main.__module__]
+    quantize = int8_model(module) if precision == "int8" else nullcontext()
+    with cached_checkpoints(module), quantize:
+        try:
+            with torch.inference_mode(), autocast_context(precision):
+                return repo_main(args)
+        except RuntimeError as e:
+            if "Inference tensor" not in str(e):
+                raise
+        with torch.no_grad(), autocast_context(precision):
+            return repo_main(args)
+
+
+def read_pdb_list(list_file):
+    """
+    Read PDB paths from a text file (one per line, '#' starts a comment)
+
+    Args:
+        list_file: Path to the list file
+
+    Returns:
+        List of PDB path strings
+    """
+    with open(list_file) as f:
+        lines = (line.split("#", 1)[0].strip() for line in f)
+        return [line for line in lines if line]
+
+
+def _pdb_list_worker(rank, world_size, chunks, run_fn, kwargs, empty_cache_every=0):
+    if torch.cuda.is_available():
+        torch.cuda.set_device(rank)
+
+    failed = []
+    for count, pdb in enumerate(chunks[rank], 1):
+        pdb_path = Path(pdb)
+        if not pdb_path.is_file():
+            print(f"❌ Error: Input file {pdb} not found")
+            failed.append(pdb)
+            continue
+        output_dir = Path(kwargs["output_dir"]) / pdb_path.stem
+        if not run_fn(input_pdb=pdb, **{**kwargs, "output_dir": output_dir}):
+            failed.append(pdb)
+        # Only between PDBs: within one PDB the warm allocator blocks are reused
+        if empty_cache_every and count % empty_cache_every == 0 and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+    if failed:
+        raise RuntimeError(f"Worker {rank}/{world_size} failed on: {', '.join(failed)}")
+
+
+def run_pdb_list(run_fn, pdb_paths, empty_cache_every=0, **kwargs):
+    """
+    Run a use case function over many PDBs, one worker process per GPU
+
+    The list is sharded round-robin across torch.cuda.device_count() workers
+    started with torch.multiprocessing.spawn; each worker pins itself to one GPU
+    and keeps its own checkpoint cache, so every model is loaded once per GPU.
+    Without multiple GPUs the PDBs are processed in this process. Outputs for
+    each PDB go to <output_dir>/<pdb stem>.
+
+    Args:
+        run_fn: Module-level use case function taking input_pdb and output_dir
+        pdb_paths: List of PDB paths to process
+        empty_cache_every: Call torch.cuda.empty_cache() after every N PDBs in
+            each worker (0 keeps the allocator cache for the whole run)
+        **kwargs: Passed through to run_fn (must include output_dir)
+
+    Returns:
+        True if every PDB was processed successfully
+    """
+    world_size = min(max(torch.cuda.device_count(), 1), len(pdb_paths))
+    if world_size == 0:
+        print("❌ Error: PDB list is empty")
+        return False
+    chunks = [pdb_paths[rank::world_size] for rank in range(world_size)]
+
+    print(f"Processing {len(pdb_paths)} PDB files with {world_size} worker(s)")
+    try:
+        if world_size == 1:
+            _pdb_list_worker(0, 1, chunks, run_fn, kwargs, empty_cache_every)
+        else:
+            torch.multiprocessing.spawn(_pdb_list_worker,
+                                        args=(world_size, chunks, run_fn, kwargs, empty_cache_every),
+                                        nprocs=world_size)
+    except Exception as e:
+        print(f"❌ Error during PDB list processing: {e}")
+        return False
+    return True
@@ -14,13 +14,23 @@ import argparse
 import os
 import sys
 import tempfile
+from contextlib import nullcontext
 from pathlib import Path
 
+# Read by the CUDA caching allocator, so it has to be set before torch is imported
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True,max_split_size_mb:128")
+
 # Add the repo directory to the path so we can import modules
 repo_path = Path(__file__).parent.parent / "repo" / "LigandMPNN"
 sys.path.insert(0, str(repo_path))
 
-def run_protein_design(input_pdb, output_dir="./outputs/protein_design", seed=111, temperature=0.1, num_sequences=3, model_type="protein_mpnn"):
+from _mpnn_args import make_args
+from _mpnn_runtime import (MATMUL_PRECISIONS, PRECISIONS, configure_torch_perf, cuda_graph_decoder, read_pdb_list,
+                           run_inference, run_pdb_list, split_batches, warm_checkpoints, warmup_kernels)
+
+def run_protein_design(input_pdb, output_dir="./outputs/protein_design", seed=111, temperature=0.1, num_sequences=3, model_type="protein_mpnn",
+                       matmul_precision="high", max_batch=None, warm_model=False,
+                       precision="fp32", cuda_graphs=False, warmup=False):
     """
     Run protein sequence design using ProteinMPNN
 
@@ -31,74 +41,53 @@ def run_protein_design(input_pdb, output_dir="./outputs/protein_design", seed=11
         temperature: Sampling temperature (higher = more diversity)
         num_sequences: Number of sequences to generate
         model_type: Type of model to use
+        matmul_precision: Float32 matmul precision (highest, high, medium)
+        max_batch: Optional cap on sequences per batched forward (default: all at once)
+        warm_model: Load the model checkpoint into the in-process cache up front
+        warmup: Run a dummy GPU pass first so the real call starts with warm kernels
+        precision: Autocast precision on GPU (fp32, bf16, fp16), or int8 on CPU
+        cuda_graphs: Replay the autoregressive decoder steps as CUDA graphs
     """
 
     # Import the main run module
-    from run import main as run_main
+    import run
+
+    input_pdb = Path(input_pdb)
+    output_dir = Path(output_dir)
 
     # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Sample all sequences in one batched forward (or a few, if capped)
+    batch_size, number_of_batches = split_batches(num_sequences, max_batch)
 
     # Set up arguments as if passed from command line
-    class Args:
-        def __init__(self):
-            self.seed = seed
-            self.pdb_path = str(input_pdb)
-            self.out_folder = str(output_dir)
-            self.temperature = temperature
-            self.model_type = model_type
-            self.batch_size = 1
-            self.number_of_batches = num_sequences
-            self.verbose = 1
-            self.save_stats = 0
-            self.checkpoint_protein_mpnn = "./repo/LigandMPNN/model_params/proteinmpnn_v_48_020.pt"
-            self.checkpoint_ligand_mpnn = "./repo/LigandMPNN/model_params/ligandmpnn_v_32_020_25.pt"
-            self.checkpoint_soluble_mpnn = "./repo/LigandMPNN/model_params/solublempnn_v_48_020.pt"
-            self.checkpoint_global_label_membrane_mpnn = "./repo/LigandMPNN/model_params/global_label_membrane_mpnn_v_48_020.pt"
-            self.checkpoint_per_residue_label_membrane_mpnn = "./repo/LigandMPNN/model_params/per_residue_label_membrane_mpnn_v_48_020.pt"
-            # Set defaults for unused parameters
-            self.fixed_residues = ""
-            self.redesigned_residues = ""
-            self.omit_AA = ""
-            self.bias_AA = ""
-            self.chains_to_design = ""
-            self.parse_these_chains_only = ""
-            self.bias_AA_per_residue = ""
-            self.omit_AA_per_residue = ""
-            self.symmetry_residues = ""
-            self.symmetry_weights = ""
-            self.homo_oligomer = 0
-            self.file_ending = ""
-            self.zero_indexed = 0
-            self.ligand_mpnn_use_atom_context = 1
-            self.ligand_mpnn_use_side_chain_context = 0
-            self.global_transmembrane_label = 0
-            self.transmembrane_buried = ""
-            self.transmembrane_interface = ""
-            self.fasta_seq_separation = ":"
-            self.pdb_path_multi = ""
-            self.fixed_residues_multi = ""
-            self.redesigned_residues_multi = ""
-            self.omit_AA_per_residue_multi = ""
-            self.bias_AA_per_residue_multi = ""
-            self.ligand_mpnn_cutoff_for_score = 8.0
-            self.pack_side_chains = 0
-            self.pack_with_ligand_context = 0
-            self.repack_everything = 0
-            self.number_of_packs_per_design = 0
-            self.checkpoint_path_sc = ""
-            self.parse_atoms_with_zero_occupancy = 0
-
-    # Create args object and run
-    args = Args()
+    args = make_args(
+        pdb_path=str(input_pdb),
+        out_folder=str(output_dir),
+        seed=seed,
+        temperature=temperature,
+        model_type=model_type,
+        batch_size=batch_size,
+        number_of_batches=number_of_batches,
+        use_cuda_graphs=1 if cuda_graphs else 0,
+    )
+
+    if warm_model:
+        warm_checkpoints(args)
 
     print(f"Running ProteinMPNN design on {input_pdb}")
     print(f"Model type: {model_type}")
     print(f"Output directory: {output_dir}")
     print(f"Generating {num_sequences} sequences with temperature {temperature}")
 
+    configure_torch_perf(matmul_precision)
+    if warmup:
+        warmup_kernels(args, precision)
+
     try:
-        run_main(args)
+        with cuda_graph_decoder(run) if args.use_cuda_graphs else nullcontext():
+            run_inference(run.main, args, precision)
         print(f"✅ Design completed successfully! Check {output_dir} for results.")
         return True
     except Exception as e:
@@ -107,7 +96,9 @@ def run_protein_design(input_pdb, output_dir="./outputs/protein_design", seed=11
 
 def main():
     parser = argparse.ArgumentParser(description="Protein sequence design using ProteinMPNN")
-    parser.add_argument("--input", "-i", required=True, help="Input PDB file")
+    inputs = parser.add_mutually_exclusive_group(required=True)
+    inputs.add_argument("--input", "-i", help="Input PDB file")
+    inputs.add_argument("--pdb_list", help="Text file with one input PDB path per line (sharded across GPUs)")
     parser.add_argument("--output", "-o", default="./outputs/protein_design",
                        help="Output directory (default: ./outputs/protein_design)")
     parser.add_argument("--seed", type=int, default=111,
@@ -119,24 +110,49 @@ def main():
     parser.add_argument("--model_type", default="protein_mpnn",
                        choices=["protein_mpnn", "ligand_mpnn", "soluble_mpnn"],
                        help="Model type (default: protein_mpnn)")
+    parser.add_argument("--max_batch", type=int, default=None,
+                       help="Max sequences per batched forward, for limited GPU memory (default: all at once)")
+    parser.add_argument("--empty_cache_every", type=int, default=0,
+                       help="With --pdb_list, release cached GPU memory after every N PDBs (default: never)")
+    parser.add_argument("--warm_model", action="store_true",
+                       help="Load the model checkpoint into the in-process cache before running")
+    parser.add_argument("--warmup", action="store_true",
+                       help="Warm up CUDA kernels before the first run, for stable timings")
+    parser.add_argument("--cuda_graphs", action="store_true",
+                       help="Replay the decoder steps as CUDA graphs (GPU only, slower first call)")
+    parser.add_argument("--precision", default="fp32", choices=PRECISIONS,
+                       help="Inference precision; bf16/fp16 autocast on GPU tensor cores, int8 quantizes on CPU (default: fp32)")
+    parser.add_argument("--matmul_precision", default="high", choices=MATMUL_PRECISIONS,
+                       help="Float32 matmul precision; high/medium enable TF32 tensor cores (default: high)")
 
     args = parser.parse_args()
 
-    # Verify input file exists
-    if not os.path.exists(args.input):
-        print(f"❌ Error: Input file {args.input} not found")
-        sys.exit(1)
-
-    # Run the design
-    success = run_protein_design(
-        input_pdb=args.input,
+    design_kwargs = dict(
         output_dir=args.output,
         seed=args.seed,
         temperature=args.temperature,
         num_sequences=args.num_sequences,
-        model_type=args.model_type
+        model_type=args.model_type,
+        matmul_precision=args.matmul_precision,
+        max_batch=args.max_batch,
+        warm_model=args.warm_model,
+        precision=args.precision,
+        cuda_graphs=args.cuda_graphs,
+        warmup=args.warmup
     )
 
+    if args.pdb_list:
+        success = run_pdb_list(run_protein_design, read_pdb_list(args.pdb_list), **design_kwargs,
+                               empty_cache_every=args.empty_cache_every)
+    else:
+        # Verify input file exists
+        if not Path(args.input).is_file():
+            print(f"❌ Error: Input file {args.input} not found")
+            sys.exit(1)
+
+        # Run the design
+        success = run_protein_design(input_pdb=args.input, **design_kwargs)
+
     if not success:
         sys.exit(1)
 
@@ -16,10 +16,15 @@ import sys
 import tempfile
 from pathlib import Path
 
+# Read by the CUDA caching allocator, so it has to be set before torch is imported
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True,max_split_size_mb:128")
+
 # Add the repo directory to the path so we can import modules
 repo_path = Path(__file__).parent.parent / "repo" / "LigandMPNN"
 sys.path.insert(0, str(repo_path))
 
+from _mpnn_args import make_args
+
 def run_ligand_design(input_pdb, output_dir="./outputs/ligand_design", seed=111, temperature=0.1,
                      num_sequences=3, use_atom_context=True, use_side_chain_context=False):
     """
@@ -38,62 +43,23 @@ def run_ligand_design(input_pdb, output_dir="./outputs/ligand_design", seed=111,
     # Import the main run module
     from run import main as run_main
 
+    input_pdb = Path(input_pdb)
+    output_dir = Path(output_dir)
+
     # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
     # Set up arguments as if passed from command line
-    class Args:
-        def __init__(self):
-            self.seed = seed
-            self.pdb_path = str(input_pdb)
-            self.out_folder = str(output_dir)
-            self.temperature = temperature
-            self.model_type = "ligand_mpnn"
-            self.batch_size = 1
-            self.number_of_batches = num_sequences
-            self.verbose = 1
-            self.save_stats = 0
-            self.ligand_mpnn_use_atom_context = 1 if use_atom_context else 0
-            self.ligand_mpnn_use_side_chain_context = 1 if use_side_chain_context else 0
-            # Model checkpoints
-            self.checkpoint_protein_mpnn = "./repo/LigandMPNN/model_params/proteinmpnn_v_48_020.pt"
-            self.checkpoint_ligand_mpnn = "./repo/LigandMPNN/model_params/ligandmpnn_v_32_020_25.pt"
-            self.checkpoint_soluble_mpnn = "./repo/LigandMPNN/model_params/solublempnn_v_48_020.pt"
-            self.checkpoint_global_label_membrane_mpnn = "./repo/LigandMPNN/model_params/global_label_membrane_mpnn_v_48_020.pt"
-            self.checkpoint_per_residue_label_membrane_mpnn = "./repo/LigandMPNN/model_params/per_residue_label_membrane_mpnn_v_48_020.pt"
-            # Set defaults for unused parameters
-            self.fixed_residues = ""
-            self.redesigned_residues = ""
-            self.omit_AA = ""
-            self.bias_AA = ""
-            self.chains_to_design = ""
-            self.parse_these_chains_only = ""
-            self.bias_AA_per_residue = ""
-            self.omit_AA_per_residue = ""
-            self.symmetry_residues = ""
-            self.symmetry_weights = ""
-            self.homo_oligomer = 0
-            self.file_ending = ""
-            self.zero_indexed = 0
-            self.global_transmembrane_label = 0
-            self.transmembrane_buried = ""
-            self.transmembrane_interface = ""
-            self.fasta_seq_separation = ":"
-            self.pdb_path_multi = ""
-            self.fixed_residues_multi = ""
-            self.redesigned_residues_multi = ""
-            self.omit_AA_per_residue_multi = ""
-            self.bias_AA_per_residue_multi = ""
-            self.ligand_mpnn_cutoff_for_score = 8.0
-            self.pack_side_chains = 0
-            self.pack_with_ligand_context = 0
-            self.repack_everything = 0
-            self.number_of_packs_per_design = 0
-            self.checkpoint_path_sc = ""
-            self.parse_atoms_with_zero_occupancy = 0
-
-    # Create args object and run
-    args = Args()
+    args = make_args(
+        pdb_path=str(input_pdb),
+        out_folder=str(output_dir),
+        seed=seed,
+        temperature=temperature,
+        model_type="ligand_mpnn",
+        number_of_batches=num_sequences,
+        ligand_mpnn_use_atom_context=1 if use_atom_context else 0,
+        ligand_mpnn_use_side_chain_context=1 if use_side_chain_context else 0,
+    )
 
     print(f"Running LigandMPNN design on {input_pdb}")
     print(f"Using ligand atom context: {use_atom_context}")
@@ -130,7 +96,7 @@ def main():
     args = parser.parse_args()
 
     # Verify input file exists
-    if not os.path.exists(args.input):
+    if not Path(args.input).is_file():
         print(f"❌ Error: Input file {args.input} not found")
         sys.exit(1)
 
@@ -14,14 +14,23 @@ import argparse
 import os
 import sys
 import tempfile
+from contextlib import nullcontext
 from pathlib import Path
 
+# Read by the CUDA caching allocator, so it has to be set before torch is imported
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True,max_split_size_mb:128")
+
 # Add the repo directory to the path so we can import modules
 repo_path = Path(__file__).parent.parent / "repo" / "LigandMPNN"
 sys.path.insert(0, str(repo_path))
 
+from _mpnn_args import make_args
+from _mpnn_runtime import (MATMUL_PRECISIONS, PRECISIONS, cached_pdb_features, configure_torch_perf, read_pdb_list,
+                           run_inference, run_pdb_list, warm_checkpoints, warmup_kernels)
+
 def run_sequence_scoring(input_pdb, output_dir="./outputs/scoring", seed=111, model_type="protein_mpnn",
-                        sequences=None):
+                        sequences=None, matmul_precision="high", warm_model=False,
+                        precision="fp32", feature_cache=False, warmup=False):
     """
     Score protein sequences using ProteinMPNN/LigandMPNN likelihood calculation
 
@@ -30,57 +39,37 @@ def run_sequence_scoring(input_pdb, output_dir="./outputs/scoring", seed=111, mo
         output_dir: Directory to save outputs
         seed: Random seed for reproducibility
         model_type: Type of model to use for scoring
-        sequences: Optional custom sequences to score (if None, scores native sequence)
+        sequences: Optional FASTA file of custom sequences to score (if None, scores native sequence)
+        matmul_precision: Float32 matmul precision (highest, high, medium)
+        warm_model: Load the model checkpoint into the in-process cache up front
+        warmup: Run a dummy GPU pass first so the real call starts with warm kernels
+        precision: Autocast precision on GPU (fp32, bf16, fp16), or int8 on CPU;
+            keep fp32 when comparing scores, reduced precision shifts
+            log-likelihoods slightly
+        feature_cache: Reuse parsed PDB features from ~/.cache/ligandmpnn/features
+            when the same structure is scored again
     """
 
     # Import the scoring module
-    from score import main as score_main
+    import score
+
+    input_pdb = Path(input_pdb)
+    output_dir = Path(output_dir)
 
     # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
     # Set up arguments as if passed from command line
-    class Args:
-        def __init__(self):
-            self.seed = seed
-            self.pdb_path = str(input_pdb)
-            self.out_folder = str(output_dir)
-            self.model_type = model_type
-            self.verbose = 1
-            # Model checkpoints
-            self.checkpoint_protein_mpnn = "./repo/LigandMPNN/model_params/proteinmpnn_v_48_020.pt"
-            self.checkpoint_ligand_mpnn = "./repo/LigandMPNN/model_params/ligandmpnn_v_32_020_25.pt"
-            self.checkpoint_soluble_mpnn = "./repo/LigandMPNN/model_params/solublempnn_v_48_020.pt"
-            self.checkpoint_global_label_membrane_mpnn = "./repo/LigandMPNN/model_params/global_label_membrane_mpnn_v_48_020.pt"
-            self.checkpoint_per_residue_label_membrane_mpnn = "./repo/LigandMPNN/model_params/per_residue_label_membrane_mpnn_v_48_020.pt"
-            # Scoring specific parameters
-            self.fasta_path = sequences if sequences else ""
-            self.chains_to_design = ""
-            self.parse_these_chains_only = ""
-            self.ligand_mpnn_use_atom_context = 1
-            self.ligand_mpnn_use_side_chain_context = 0
-            self.global_transmembrane_label = 0
-            self.transmembrane_buried = ""
-            self.transmembrane_interface = ""
-            self.ligand_mpnn_cutoff_for_score = 8.0
-            self.parse_atoms_with_zero_occupancy = 0
-            self.pdb_path_multi = ""
-            self.fixed_residues = ""
-            self.fixed_residues_multi = ""
-            self.redesigned_residues = ""
-            self.redesigned_residues_multi = ""
-            self.symmetry_residues = ""
-            self.homo_oligomer = 0
-            self.file_ending = ""
-            self.zero_indexed = 0
-            self.batch_size = 1
-            self.number_of_batches = 1
-            self.autoregressive_score = 0
-            self.use_sequence = 1
-            self.single_aa_score = 1
-
-    # Create args object and run
-    args = Args()
+    args = make_args(
+        pdb_path=str(input_pdb),
+        out_folder=str(output_dir),
+        seed=seed,
+        model_type=model_type,
+        fasta_path=str(sequences) if sequences else "",
+    )
+
+    if warm_model:
+        warm_checkpoints(args)
 
     print(f"Scoring sequences using {model_type} on {input_pdb}")
     print(f"Output directory: {output_dir}")
@@ -89,8 +78,13 @@ def run_sequence_scoring(input_pdb, output_dir="./outputs/scoring", seed=111, mo
     else:
         print("Scoring native sequence from PDB")
 
+    configure_torch_perf(matmul_precision)
+    if warmup:
+        warmup_kernels(args, precision)
+
     try:
-        score_main(args)
+        with cached_pdb_features(score) if feature_cache else nullcontext():
+            run_inference(score.main, args, precision)
         print(f"✅ Sequence scoring completed successfully! Check {output_dir} for results.")
         print(f"   - Scores will be saved as: {output_dir}/score_only/")
         return True
@@ -109,16 +103,17 @@ def create_custom_sequences_file(sequences, output_path):
     if isinstance(sequences, str):
         sequences = [sequences]
 
-    with open(output_path, 'w') as f:
-        for i, seq in enumerate(sequences):
-            f.write(f">sequence_{i+1}\n")
-            f.write(f"{seq}\n")
+    lines = [f">sequence_{i}\n{seq}\n" for i, seq in enumerate(sequences, 1)]
+    with open(output_path, 'w', buffering=1 << 20) as f:
+        f.writelines(lines)
 
     return output_path
 
 def main():
     parser = argparse.ArgumentParser(description="Protein sequence scoring using ProteinMPNN/LigandMPNN")
-    parser.add_argument("--input", "-i", required=True, help="Input PDB file")
+    inputs = parser.add_mutually_exclusive_group(required=True)
+    inputs.add_argument("--input", "-i", help="Input PDB file")
+    inputs.add_argument("--pdb_list", help="Text file with one input PDB path per line (sharded across GPUs)")
     parser.add_argument("--output", "-o", default="./outputs/scoring",
                        help="Output directory (default: ./outputs/scoring)")
     parser.add_argument("--seed", type=int, default=111,
@@ -130,11 +125,23 @@ def main():
                        help="Custom sequences to score (comma-separated)")
     parser.add_argument("--sequences_file", type=str,
                        help="FASTA file with sequences to score")
+    parser.add_argument("--empty_cache_every", type=int, default=0,
+                       help="With --pdb_list, release cached GPU memory after every N PDBs (default: never)")
+    parser.add_argument("--warm_model", action="store_true",
+                       help="Load the model checkpoint into the in-process cache before running")
+    parser.add_argument("--warmup", action="store_true",
+                       help="Warm up CUDA kernels before the first run, for stable timings")
+    parser.add_argument("--feature_cache", action="store_true",
+                       help="Cache parsed PDB features on disk for repeated scoring of the same structure")
+    parser.add_argument("--precision", default="fp32", choices=PRECISIONS,
+                       help="Inference precision; bf16/fp16 autocast on GPU tensor cores, int8 quantizes on CPU (default: fp32)")
+    parser.add_argument("--matmul_precision", default="high", choices=MATMUL_PRECISIONS,
+                       help="Float32 matmul precision; high/medium enable TF32 tensor cores (default: high)")
 
     args = parser.parse_args()
 
     # Verify input file exists
-    if not os.path.exists(args.input):
+    if args.input and not Path(args.input).is_file():
         print(f"❌ Error: Input file {args.input} not found")
         sys.exit(1)
 
@@ -142,28 +149,39 @@ def main():
     if args.sequences:
         # Create temporary FASTA file for custom sequences
         sequences_list = [s.strip() for s in args.sequences.split(',')]
-        temp_path = os.path.join(args.output, "temp_sequences.fasta")
-        os.makedirs(args.output, exist_ok=True)
-        sequences_file = create_custom_sequences_file(sequences_list, temp_path)
+        output_dir = Path(args.output)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        sequences_file = create_custom_sequences_file(sequences_list, output_dir / "temp_sequences.fasta")
         print(f"Created temporary sequences file: {sequences_file}")
     elif args.sequences_file:
-        if not os.path.exists(args.sequences_file):
+        if not Path(args.sequences_file).is_file():
             print(f"❌ Error: Sequences file {args.sequences_file} not found")
             sys.exit(1)
         sequences_file = args.sequences_file
 
-    # Run the scoring
-    success = run_sequence_scoring(
-        input_pdb=args.input,
+    scoring_kwargs = dict(
         output_dir=args.output,
         seed=args.seed,
         model_type=args.model_type,
-        sequences=sequences_file
+        sequences=sequences_file,
+        matmul_precision=args.matmul_precision,
+        warm_model=args.warm_model,
+        precision=args.precision,
+        feature_cache=args.feature_cache,
+        warmup=args.warmup
     )
 
-    # Clean up temporary file
-    if args.sequences and sequences_file and os.path.exists(sequences_file):
-        os.remove(sequences_file)
+    # Run the scoring
+    try:
+        if args.pdb_list:
+            success = run_pdb_list(run_sequence_scoring, read_pdb_list(args.pdb_list), **scoring_kwargs,
+                                   empty_cache_every=args.empty_cache_every)
+        else:
+            success = run_sequence_scoring(input_pdb=args.input, **scoring_kwargs)
+    finally:
+        # Clean up temporary file
+        if args.sequences and sequences_file:
+            Path(sequences_file).unlink(missing_ok=True)
 
     if not success:
         sys.exit(1)
@@ -11,21 +11,37 @@ python examples/use_case_5_constrained_design.py --input examples/data/1BC8.pdb
 """
 
 import argparse
+import hashlib
 import os
 import sys
 import json
 import tempfile
+from contextlib import nullcontext
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Read by the CUDA caching allocator, so it has to be set before torch is imported
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True,max_split_size_mb:128")
+
 # Add the repo directory to the path so we can import modules
 repo_path = Path(__file__).parent.parent / "repo" / "LigandMPNN"
 sys.path.insert(0, str(repo_path))
 
+from _mpnn_args import make_args
+from _mpnn_runtime import cuda_graph_decoder, run_inference
+
+CONSTRAINTS_CACHE_DIR = Path.home() / ".cache" / "ligandmpnn" / "constraints"
+
 def run_constrained_design(input_pdb, output_dir="./outputs/constrained_design", seed=111,
                           temperature=0.1, num_sequences=3, model_type="ligand_mpnn",
                           fixed_residues="", redesigned_residues="", omit_AA="",
                           bias_AA="", bias_AA_per_residue=None, omit_AA_per_residue=None,
-                          chains_to_design="", homo_oligomer=False):
+                          chains_to_design="", homo_oligomer=False, compile_model=True,
+                          verbose=True):
     """
     Run constrained protein sequence design
 
@@ -40,141 +56,145 @@ def run_constrained_design(input_pdb, output_dir="./outputs/constrained_design",
         redesigned_residues: Space-separated residues to redesign (others fixed)
         omit_AA: Amino acids to globally avoid (e.g., "CDFGH")
         bias_AA: Global amino acid biases (e.g., "A:2.0,P:-1.0")
-        bias_AA_per_residue: Dict of per-residue biases
-        omit_AA_per_residue: Dict of per-residue omissions
+        bias_AA_per_residue: Dict of per-residue biases, or path to a JSON file
+        omit_AA_per_residue: Dict of per-residue omissions, or path to a JSON file
         chains_to_design: Specific chains to design (e.g., "A,B")
         homo_oligomer: Whether to design as homooligomer with symmetry
+        compile_model: Compile the decoder with torch.compile (reduce-overhead,
+            CUDA only); the first call in a fresh cache pays the compilation time
+        verbose: Print the run banner and completion message (errors are
+            always reported)
     """
 
     # Import the main run module
-    from run import main as run_main
+    import run
+
+    input_pdb = Path(input_pdb)
+    output_dir = Path(output_dir)
 
     # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
     # Handle JSON files for per-residue constraints
-    bias_AA_per_residue_file = ""
-    omit_AA_per_residue_file = ""
-
-    if bias_AA_per_residue:
-        bias_file_path = os.path.join(output_dir, "temp_bias_per_residue.json")
-        with open(bias_file_path, 'w') as f:
-            json.dump(bias_AA_per_residue, f)
-        bias_AA_per_residue_file = bias_file_path
-
-    if omit_AA_per_residue:
-        omit_file_path = os.path.join(output_dir, "temp_omit_per_residue.json")
-        with open(omit_file_path, 'w') as f:
-            json.dump(omit_AA_per_residue, f)
-        omit_AA_per_residue_file = omit_file_path
+    bias_AA_per_residue_file = per_residue_json(bias_AA_per_residue)
+    omit_AA_per_residue_file = per_residue_json(omit_AA_per_residue)
 
     # Set up arguments as if passed from command line
-    class Args:
-        def __init__(self):
-            self.seed = seed
-            self.pdb_path = str(input_pdb)
-            self.out_folder = str(output_dir)
-            self.temperature = temperature
-            self.model_type = model_type
-            self.batch_size = 1
-            self.number_of_batches = num_sequences
-            self.verbose = 1
-            self.save_stats = 0
-            # Constraint parameters
-            self.fixed_residues = fixed_residues
-            self.redesigned_residues = redesigned_residues
-            self.omit_AA = omit_AA
-            self.bias_AA = bias_AA
-            self.bias_AA_per_residue = bias_AA_per_residue_file
-            self.omit_AA_per_residue = omit_AA_per_residue_file
-            self.chains_to_design = chains_to_design
-            self.homo_oligomer = 1 if homo_oligomer else 0
-            # Model checkpoints
-            self.checkpoint_protein_mpnn = "./repo/LigandMPNN/model_params/proteinmpnn_v_48_020.pt"
-            self.checkpoint_ligand_mpnn = "./repo/LigandMPNN/model_params/ligandmpnn_v_32_020_25.pt"
-            self.checkpoint_soluble_mpnn = "./repo/LigandMPNN/model_params/solublempnn_v_48_020.pt"
-            self.checkpoint_global_label_membrane_mpnn = "./repo/LigandMPNN/model_params/global_label_membrane_mpnn_v_48_020.pt"
-            self.checkpoint_per_residue_label_membrane_mpnn = "./repo/LigandMPNN/model_params/per_residue_label_membrane_mpnn_v_48_020.pt"
-            # Set defaults for unused parameters
-            self.parse_these_chains_only = ""
-            self.symmetry_residues = ""
-            self.symmetry_weights = ""
-            self.file_ending = ""
-            self.zero_indexed = 0
-            self.ligand_mpnn_use_atom_context = 1
-            self.ligand_mpnn_use_side_chain_context = 0
-            self.global_transmembrane_label = 0
-            self.transmembrane_buried = ""
-            self.transmembrane_interface = ""
-            self.fasta_seq_separation = ":"
-            self.pdb_path_multi = ""
-            self.fixed_residues_multi = ""
-            self.redesigned_residues_multi = ""
-            self.omit_AA_per_residue_multi = ""
-            self.bias_AA_per_residue_multi = ""
-            self.ligand_mpnn_cutoff_for_score = 8.0
-            self.pack_side_chains = 0
-            self.pack_with_ligand_context = 0
-            self.repack_everything = 0
-            self.number_of_packs_per_design = 0
-            self.checkpoint_path_sc = ""
-            self.parse_atoms_with_zero_occupancy = 0
-
-    # Create args object and run
-    args = Args()
-
-    print(f"Running constrained design using {model_type} on {input_pdb}")
-    print(f"Output directory: {output_dir}")
-    print(f"Generating {num_sequences} sequences with temperature {temperature}")
-    if fixed_residues:
-        print(f"Fixed residues: {fixed_residues}")
-    if redesigned_residues:
-        print(f"Redesigned residues: {redesigned_residues}")
-    if omit_AA:
-        print(f"Omitted amino acids: {omit_AA}")
-    if bias_AA:
-        print(f"Global biases: {bias_AA}")
-    if chains_to_design:
-        print(f"Chains to design: {chains_to_design}")
-    if homo_oligomer:
-        print("Homooligomer design with automatic symmetry")
+    args = make_args(
+        pdb_path=str(input_pdb),
+        out_folder=str(output_dir),
+        seed=seed,
+        temperature=temperature,
+        model_type=model_type,
+        number_of_batches=num_sequences,
+        fixed_residues=fixed_residues,
+        redesigned_residues=redesigned_residues,
+        omit_AA=omit_AA,
+        bias_AA=bias_AA,
+        bias_AA_per_residue=bias_AA_per_residue_file,
+        omit_AA_per_residue=omit_AA_per_residue_file,
+        chains_to_design=chains_to_design,
+        homo_oligomer=1 if homo_oligomer else 0,
+    )
+
+    if verbose:
+        banner = [
+            f"Running constrained design using {model_type} on {input_pdb}",
+            f"Output directory: {output_dir}",
+            f"Generating {num_sequences} sequences with temperature {temperature}",
+        ]
+        if fixed_residues:
+            banner.append(f"Fixed residues: {fixed_residues}")
+        if redesigned_residues:
+            banner.append(f"Redesigned residues: {redesigned_residues}")
+        if omit_AA:
+            banner.append(f"Omitted amino acids: {omit_AA}")
+        if bias_AA:
+            banner.append(f"Global biases: {bias_AA}")
+        if chains_to_design:
+            banner.append(f"Chains to design: {chains_to_design}")
+        if homo_oligomer:
+            banner.append("Homooligomer design with automatic symmetry")
+        write_lines(banner)
 
     try:
-        run_main(args)
-        print(f"✅ Constrained design completed successfully! Check {output_dir} for results.")
+        with cuda_graph_decoder(run) if compile_model else nullcontext():
+            run_inference(run.main, args)
+        if verbose:
+            write_lines([f"✅ Constrained design completed successfully! Check {output_dir} for results."])
         return True
     except Exception as e:
-        print(f"❌ Error during constrained design: {e}")
+        write_lines([f"❌ Error during constrained design: {e}"])
         return False
-    finally:
-        # Clean up temporary files
-        if bias_AA_per_residue and os.path.exists(bias_file_path):
-            os.remove(bias_file_path)
-        if omit_AA_per_residue and os.path.exists(omit_file_path):
-            os.remove(omit_file_path)
+
+def write_lines(lines):
+    """Write lines to stdout in a single call, so concurrent runs don't interleave them"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+def per_residue_json(constraints):
+    """
+    Get a JSON file path for per-residue constraints
+
+    run.main reads per-residue constraints from JSON files. Dicts are written
+    once to a content-addressed file under CONSTRAINTS_CACHE_DIR, so repeated
+    calls with the same constraints (e.g. across a batch of PDBs) reuse it
+    instead of writing and removing a temp file each time.
+
+    Args:
+        constraints: Dict of per-residue constraints, a path to an existing
+            JSON file, or None
+
+    Returns:
+        Path string to pass to run.main ("" when there are no constraints)
+    """
+    if not constraints:
+        return ""
+    if isinstance(constraints, (str, os.PathLike)):
+        return os.fspath(constraints)
+
+    if orjson is not None:
+        payload = orjson.dumps(constraints, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(constraints, sort_keys=True).encode()
+    json_path = CONSTRAINTS_CACHE_DIR / f"{hashlib.sha1(payload).hexdigest()}.json"
+    if not json_path.exists():
+        CONSTRAINTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = json_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, json_path)
+    return str(json_path)
+
+def _find_any(text, chars, start, stop):
+    """Index of the first of chars in text[start:stop], or stop if none occur"""
+    hits = [i for i in (text.find(ch, start, stop) for ch in chars) if i != -1]
+    return min(hits) if hits else stop
 
 def parse_per_residue_dict(dict_str):
     """Parse per-residue dictionary from string format like 'C1:A:2.0,G:-1.0;C2:P:3.0' """
     if not dict_str:
         return None
 
+    # Single scan: ';' ends a residue, ':' ends the residue / AA name,
+    # and ',' or ':' ends a bias value
     result = {}
-    for residue_spec in dict_str.split(';'):
-        parts = residue_spec.split(':')
-        if len(parts) < 2:
-            continue
-        residue = parts[0]
-        aa_specs = parts[1:]
-
-        if residue not in result:
-            result[residue] = {}
-
-        # Parse AA:bias pairs
-        for i in range(0, len(aa_specs), 2):
-            if i + 1 < len(aa_specs):
-                aa = aa_specs[i]
-                bias = float(aa_specs[i + 1])
-                result[residue][aa] = bias
+    pos, end = 0, len(dict_str)
+    while pos < end:
+        spec_end = dict_str.find(';', pos)
+        if spec_end == -1:
+            spec_end = end
+        colon = dict_str.find(':', pos, spec_end)
+        if colon != -1:
+            biases = result.setdefault(dict_str[pos:colon], {})
+            tok = colon + 1
+            while tok < spec_end:
+                aa_end = dict_str.find(':', tok, spec_end)
+                if aa_end == -1:
+                    break
+                bias_end = _find_any(dict_str, ',:', aa_end + 1, spec_end)
+                biases[dict_str[tok:aa_end]] = float(dict_str[aa_end + 1:bias_end])
+                tok = bias_end + 1
+        pos = spec_end + 1
 
     return result
 
@@ -206,6 +226,8 @@ def main():
                        help="Specific chains to design (e.g., 'A,B')")
     parser.add_argument("--homo_oligomer", action="store_true",
                        help="Design as homooligomer with automatic symmetry")
+    parser.add_argument("--no_compile", action="store_true",
+                       help="Run the decoder eagerly instead of with torch.compile")
 
     # Advanced per-residue constraints
     parser.add_argument("--bias_AA_per_residue", type=str, default="",
@@ -216,7 +238,7 @@ def main():
     args = parser.parse_args()
 
     # Verify input file exists
-    if not os.path.exists(args.input):
+    if not Path(args.input).is_file():
         print(f"❌ Error: Input file {args.input} not found")
         sys.exit(1)
 
@@ -227,9 +249,9 @@ def main():
     if args.omit_AA_per_residue:
         omit_per_residue = {}
         for spec in args.omit_AA_per_residue.split(';'):
-            parts = spec.split(':')
-            if len(parts) == 2:
-                omit_per_residue[parts[0]] = parts[1]
+            residue, sep, omitted = spec.partition(':')
+            if sep and ':' not in omitted:
+                omit_per_residue[residue] = omitted
 
     # Run the constrained design
     success = run_constrained_design(
@@ -246,7 +268,8 @@ def main():
         bias_AA_per_residue=bias_per_residue,
         omit_AA_per_residue=omit_per_residue,
         chains_to_design=args.chains_to_design,
-        homo_oligomer=args.homo_oligomer
+        homo_oligomer=args.homo_oligomer,
+        compile_model=not args.no_compile
     )
 
     if not success:
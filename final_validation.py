@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Final validation of the complete MCP server."""
 
+import os
 import sys
 from pathlib import Path
 import json
@@ -9,6 +10,13 @@ import json
 SCRIPT_DIR = Path(__file__).parent.resolve()
 sys.path.insert(0, str(SCRIPT_DIR / "src"))
 
+def list_dir(directory):
+    """Names in a directory from one listdir call (empty set if it doesn't exist)."""
+    try:
+        return set(os.listdir(directory))
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
 def validate_server_structure():
     """Validate that all server files exist."""
     print("=== Validating Server Structure ===")
@@ -20,10 +28,14 @@ def validate_server_structure():
         "src/__init__.py",
     ]
 
+    # One listdir per parent directory instead of a stat per file
+    listings = {}
     missing = []
     for file_path in required_files:
-        full_path = SCRIPT_DIR / file_path
-        if not full_path.exists():
+        parent, name = os.path.split(file_path)
+        if parent not in listings:
+            listings[parent] = list_dir(SCRIPT_DIR / parent)
+        if name not in listings[parent]:
             missing.append(file_path)
         else:
             print(f"✅ {file_path}")
@@ -110,19 +122,21 @@ def validate_examples():
 
     examples_dir = SCRIPT_DIR / "examples" / "data"
 
-    if not examples_dir.exists():
+    try:
+        entries = os.listdir(examples_dir)
+    except FileNotFoundError:
         print(f"❌ Examples directory missing: {examples_dir}\n")
         return False
 
-    pdb_files = list(examples_dir.glob("*.pdb"))
-    json_files = list(examples_dir.glob("*.json"))
+    pdb_files = [name for name in entries if name.endswith(".pdb")]
+    json_files = [name for name in entries if name.endswith(".json")]
 
     print(f"✅ Found {len(pdb_files)} PDB files")
     print(f"✅ Found {len(json_files)} JSON configuration files")
 
     # Check for specific expected files
     expected_pdbs = ["1BC8.pdb", "4GYT.pdb", "2GFB.pdb"]
-    found_pdbs = [f.name for f in pdb_files]
+    found_pdbs = set(pdb_files)
 
     for expected in expected_pdbs:
         if expected in found_pdbs:
@@ -139,16 +153,17 @@ def validate_configuration():
 
     configs_dir = SCRIPT_DIR / "configs"
 
-    if not configs_dir.exists():
+    try:
+        config_files = [name for name in os.listdir(configs_dir) if name.endswith(".json")]
+    except FileNotFoundError:
         print("⚠️ Configs directory missing (optional)")
         return True
 
-    config_files = list(configs_dir.glob("*.json"))
     print(f"✅ Found {len(config_files)} configuration files")
 
     # Test loading one config file if available
     if config_files:
-        test_config = config_files[0]
+        test_config = configs_dir / config_files[0]
         try:
             with open(test_config) as f:
                 config_data = json.load(f)
@@ -17,12 +17,13 @@ Example:
 # Minimal Imports (only essential packages)
 # ==============================================================================
 import argparse
+import functools
 import os
-import sys
-import json
 from pathlib import Path
 from typing import Union, Optional, Dict, Any, List
 
+from lib.repo_interface import add_constraints_to_args, create_base_args, get_repo_runner
+
 # ==============================================================================
 # Configuration (extracted from use case)
 # ==============================================================================
@@ -50,36 +51,10 @@ DEFAULT_CONFIG = {
 # Path Configuration
 # ==============================================================================
 SCRIPT_DIR = Path(__file__).parent
-MCP_ROOT = SCRIPT_DIR.parent
-
-PATHS = {
-    "repo": MCP_ROOT / "repo" / "LigandMPNN",
-    "models": {
-        "proteinmpnn": MCP_ROOT / "repo" / "LigandMPNN" / "model_params" / "proteinmpnn_v_48_020.pt",
-        "ligandmpnn": MCP_ROOT / "repo" / "LigandMPNN" / "model_params" / "ligandmpnn_v_32_020_25.pt",
-        "solublempnn": MCP_ROOT / "repo" / "LigandMPNN" / "model_params" / "solublempnn_v_48_020.pt",
-        "global_label_membrane": MCP_ROOT / "repo" / "LigandMPNN" / "model_params" / "global_label_membrane_mpnn_v_48_020.pt",
-        "per_residue_label_membrane": MCP_ROOT / "repo" / "LigandMPNN" / "model_params" / "per_residue_label_membrane_mpnn_v_48_020.pt"
-    },
-    "examples_data": MCP_ROOT / "examples" / "data"
-}
 
 # ==============================================================================
 # Repository Interface Functions
 # ==============================================================================
-def get_repo_runner():
-    """Lazy load repo run module to minimize startup time."""
-    repo_path = PATHS["repo"]
-    if not repo_path.exists():
-        raise FileNotFoundError(f"Repository not found at {repo_path}")
-
-    sys.path.insert(0, str(repo_path))
-    try:
-        from run import main as run_main
-        return run_main
-    except ImportError as e:
-        raise ImportError(f"Failed to import repo run module: {e}")
-
 def create_args_object(
     input_pdb: Path,
     output_dir: Path,
@@ -89,80 +64,25 @@ def create_args_object(
     config: Optional[Dict[str, Any]] = None
 ):
     """Create Args object for repo function call."""
-    config = {**DEFAULT_CONFIG, **(config or {})}
-
-    class Args:
-        def __init__(self):
-            # Basic parameters
-            self.seed = config["seed"]
-            self.pdb_path = str(input_pdb)
-            self.out_folder = str(output_dir)
-            self.temperature = config["temperature"]
-            self.model_type = config["model_type"]
-            self.batch_size = config["batch_size"]
-            self.number_of_batches = num_sequences
-            self.verbose = config["verbose"]
-            self.save_stats = config["save_stats"]
-
-            # Model checkpoints
-            self.checkpoint_protein_mpnn = str(PATHS["models"]["proteinmpnn"])
-            self.checkpoint_ligand_mpnn = str(PATHS["models"]["ligandmpnn"])
-            self.checkpoint_soluble_mpnn = str(PATHS["models"]["solublempnn"])
-            self.checkpoint_global_label_membrane_mpnn = str(PATHS["models"]["global_label_membrane"])
-            self.checkpoint_per_residue_label_membrane_mpnn = str(PATHS["models"]["per_residue_label_membrane"])
-
-            # Constraint parameters
-            self.fixed_residues = fixed_residues
-            self.redesigned_residues = redesigned_residues
-
-            # Default empty/zero parameters
-            self.omit_AA = ""
-            self.bias_AA = ""
-            self.chains_to_design = ""
-            self.parse_these_chains_only = ""
-            self.bias_AA_per_residue = ""
-            self.omit_AA_per_residue = ""
-            self.symmetry_residues = ""
-            self.symmetry_weights = ""
-            self.homo_oligomer = config["homo_oligomer"]
-            self.file_ending = ""
-            self.zero_indexed = config["zero_indexed"]
-            self.ligand_mpnn_use_atom_context = config["ligand_mpnn_use_atom_context"]
-            self.ligand_mpnn_use_side_chain_context = config["ligand_mpnn_use_side_chain_context"]
-            self.global_transmembrane_label = config["global_transmembrane_label"]
-            self.transmembrane_buried = ""
-            self.transmembrane_interface = ""
-            self.fasta_seq_separation = ":"
-            self.pdb_path_multi = ""
-            self.fixed_residues_multi = ""
-            self.redesigned_residues_multi = ""
-            self.omit_AA_per_residue_multi = ""
-            self.bias_AA_per_residue_multi = ""
-            self.ligand_mpnn_cutoff_for_score = config["ligand_mpnn_cutoff_for_score"]
-            self.pack_side_chains = config["pack_side_chains"]
-            self.pack_with_ligand_context = config["pack_with_ligand_context"]
-            self.repack_everything = config["repack_everything"]
-            self.number_of_packs_per_design = config["number_of_packs_per_design"]
-            self.checkpoint_path_sc = ""
-            self.parse_atoms_with_zero_occupancy = config["parse_atoms_with_zero_occupancy"]
-
-    return Args()
+    config = {**DEFAULT_CONFIG, **(config or {}), "number_of_batches": num_sequences}
+    args = create_base_args(input_pdb, output_dir, config)
+    add_constraints_to_args(args, fixed_residues, redesigned_residues)
+    return args
 
 # ==============================================================================
 # Utility Functions
 # ==============================================================================
 def load_config(config_file: Path) -> dict:
-    """Load configuration from JSON file."""
-    with open(config_file) as f:
-        return json.load(f)
+    """Load configuration from JSON file (parsed with orjson when available)."""
+    from lib.io import load_config as _load_config
+
+    return _load_config(config_file)
 
-def validate_inputs(input_file: Path) -> None:
-    """Validate input files exist."""
-    if not input_file.exists():
-        raise FileNotFoundError(f"Input file not found: {input_file}")
+def validate_inputs(input_file: Union[str, Path]) -> os.stat_result:
+    """Validate input files exist; returns the input's stat result."""
+    from lib.validation import validate_pdb_file
 
-    if not input_file.suffix.lower() == '.pdb':
-        raise ValueError(f"Input file must be a PDB file, got: {input_file.suffix}")
+    return validate_pdb_file(input_file)
 
 def parse_residue_list(residue_string: str) -> List[str]:
     """Parse residue specification string into list."""
@@ -171,11 +91,8 @@ def parse_residue_list(residue_string: str) -> List[str]:
 
     # Handle both space and comma separated
     if " " in residue_string:
-        return [res.strip() for res in residue_string.split()]
-    elif "," in residue_string:
-        return [res.strip() for res in residue_string.split(",")]
-    else:
-        return [residue_string.strip()]
+        return residue_string.split()
+    return [res.strip() for res in residue_string.split(",")]
 
 def format_residue_list(residue_list: List[str]) -> str:
     """Format residue list back to string."""
@@ -183,35 +100,9 @@ def format_residue_list(residue_list: List[str]) -> str:
 
 def collect_outputs(output_dir: Path) -> Dict[str, Any]:
     """Collect generated output files and metadata."""
-    outputs = {
-        "sequences": [],
-        "backbones": [],
-        "packed": [],
-        "metadata": {}
-    }
-
-    # Look for output directories
-    seqs_dir = output_dir / "seqs"
-    backbones_dir = output_dir / "backbones"
-    packed_dir = output_dir / "packed"
+    from lib.io import collect_design_outputs
 
-    if seqs_dir.exists():
-        outputs["sequences"] = list(seqs_dir.glob("*.fa"))
-
-    if backbones_dir.exists():
-        outputs["backbones"] = list(backbones_dir.glob("*.pdb"))
-
-    if packed_dir.exists():
-        outputs["packed"] = list(packed_dir.glob("*.pdb"))
-
-    outputs["metadata"] = {
-        "total_sequences": len(outputs["sequences"]),
-        "output_dir": str(output_dir),
-        "has_backbones": len(outputs["backbones"]) > 0,
-        "has_packed": len(outputs["packed"]) > 0
-    }
-
-    return outputs
+    return collect_design_outputs(output_dir)
 
 # ==============================================================================
 # Core Function (main logic extracted from use case)
@@ -339,7 +230,9 @@ def run_constrained_design(
 # ==============================================================================
 # CLI Interface
 # ==============================================================================
-def main():
+@functools.lru_cache(maxsize=None)
+def _build_parser():
+    """Build the CLI parser once per process."""
     parser = argparse.ArgumentParser(
         description=__doc__,
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -356,8 +249,11 @@ def main():
     parser.add_argument('--seed', type=int, help='Random seed (overrides config)')
     parser.add_argument('--fixed_residues', help='Fixed residues (e.g., "C1 C2 C3")')
     parser.add_argument('--redesigned_residues', help='Redesigned residues (e.g., "C4 C5")')
+    return parser
+
 
-    args = parser.parse_args()
+def main():
+    args = _build_parser().parse_args()
 
     # Load config if provided
     config = None
@@ -3,16 +3,41 @@ Shared library for LigandMPNN/ProteinMPNN MCP scripts.
 
 This library contains common functions used across multiple scripts,
 extracted and simplified to minimize dependencies.
+
+Submodules are imported on first attribute access (PEP 562), so importing
+the package alone does not touch the repository paths.
 """
 
-from .io import load_config, save_config
-from .validation import validate_inputs, validate_pdb_file
-from .repo_interface import get_repo_runner, get_repo_scorer, create_base_args
-from .paths import PATHS, setup_paths
-
-__all__ = [
-    'load_config', 'save_config',
-    'validate_inputs', 'validate_pdb_file',
-    'get_repo_runner', 'get_repo_scorer', 'create_base_args',
-    'PATHS', 'setup_paths'
-]
\ No newline at end of file
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    'load_config': 'io',
+    'save_config': 'io',
+    'validate_inputs': 'validation',
+    'validate_pdb_file': 'validation',
+    'validate_sequences': 'validation',
+    'get_repo_runner': 'repo_interface',
+    'get_repo_scorer': 'repo_interface',
+    'create_base_args': 'repo_interface',
+    'add_sequence_to_args': 'repo_interface',
+    'add_constraints_to_args': 'repo_interface',
+    'PATHS': 'paths',
+    'setup_paths': 'paths',
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    try:
+        submodule = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,30 +5,68 @@ These functions are extracted and simplified from repo code
 to minimize dependencies and provide consistent file handling.
 """
 
+import copy
+import functools
 import json
+import os
+import sys
 from pathlib import Path
 from typing import Dict, Any, Union, List
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+def _intern_strings(value: Any) -> Any:
+    """Intern every string in a decoded JSON value so repeated values share one object."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {sys.intern(k): _intern_strings(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_intern_strings(v) for v in value]
+    return value
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # mtime_ns/size are only part of the cache key, so an edited file is re-read
+    with open(path, "rb") as f:
+        return _intern_strings(_loads(f.read()))
+
 
 def load_config(config_file: Path) -> Dict[str, Any]:
     """
     Load configuration from JSON file.
 
+    Parsed configs are cached per path and reused until the file's mtime or
+    size changes; each call gets its own copy.
+
     Args:
         config_file: Path to JSON config file
 
     Returns:
-        Dict containing configuration
+        Dict containing configuration, with its strings interned
 
     Raises:
         FileNotFoundError: If config file doesn't exist
         JSONDecodeError: If config file is invalid JSON
     """
-    if not config_file.exists():
-        raise FileNotFoundError(f"Config file not found: {config_file}")
-
-    with open(config_file) as f:
-        return json.load(f)
+    try:
+        st = os.stat(config_file)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_file}") from None
+    return copy.deepcopy(_load_config_cached(os.fspath(config_file), st.st_mtime_ns, st.st_size))
 
 
 def save_config(config: Dict[str, Any], config_file: Path) -> None:
@@ -40,8 +78,11 @@ def save_config(config: Dict[str, Any], config_file: Path) -> None:
         config_file: Path to save config file
     """
     config_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(config_file, 'w') as f:
-        json.dump(config, f, indent=2)
+    config_file.write_bytes(_dumps(config))
+
+
+# Maps both sequence separators onto one sentinel character
+_SEP_TABLE = str.maketrans({"/": "\x01", ",": "\x01"})
 
 
 def parse_sequences(sequences_input: str) -> List[str]:
@@ -59,13 +100,9 @@ def parse_sequences(sequences_input: str) -> List[str]:
     if not sequences_input:
         return []
 
-    # Handle both "/" and "," as separators
-    if "/" in sequences_input:
-        return [seq.strip() for seq in sequences_input.split("/")]
-    elif "," in sequences_input:
-        return [seq.strip() for seq in sequences_input.split(",")]
-    else:
-        return [sequences_input.strip()]
+    # Handle both "/" and "," as separators in a single pass
+    parts = sequences_input.translate(_SEP_TABLE).split("\x01")
+    return [seq for seq in (part.strip() for part in parts) if seq]
 
 
 def parse_residue_list(residue_string: str) -> List[str]:
@@ -83,11 +120,8 @@ def parse_residue_list(residue_string: str) -> List[str]:
 
     # Handle both space and comma separated
     if " " in residue_string:
-        return [res.strip() for res in residue_string.split()]
-    elif "," in residue_string:
-        return [res.strip() for res in residue_string.split(",")]
-    else:
-        return [residue_string.strip()]
+        return residue_string.split()
+    return [res.strip() for res in residue_string.split(",")]
 
 
 def format_residue_list(residue_list: List[str]) -> str:
@@ -103,15 +137,31 @@ def format_residue_list(residue_list: List[str]) -> str:
     return " ".join(residue_list)
 
 
+# Output subdirectory -> (outputs key, file suffix)
+_DESIGN_OUTPUT_DIRS = {
+    "seqs": ("sequences", ".fa"),
+    "backbones": ("backbones", ".pdb"),
+    "packed": ("packed", ".pdb"),
+}
+
+
+def _scan_files(directory: str, suffix: str) -> List[str]:
+    with os.scandir(directory) as entries:
+        return [entry.path for entry in entries if entry.name.endswith(suffix) and entry.is_file()]
+
+
 def collect_design_outputs(output_dir: Path) -> Dict[str, Any]:
     """
     Collect generated output files from design runs.
 
+    Walks output_dir with os.scandir, so file types come from the directory
+    listing itself rather than a stat() per entry.
+
     Args:
         output_dir: Directory to scan for outputs
 
     Returns:
-        Dict with file lists and metadata
+        Dict with file lists (as path strings) and metadata
     """
     outputs = {
         "sequences": [],
@@ -121,18 +171,16 @@ def collect_design_outputs(output_dir: Path) -> Dict[str, Any]:
     }
 
     # Look for output directories
-    seqs_dir = output_dir / "seqs"
-    backbones_dir = output_dir / "backbones"
-    packed_dir = output_dir / "packed"
-
-    if seqs_dir.exists():
-        outputs["sequences"] = list(seqs_dir.glob("*.fa"))
-
-    if backbones_dir.exists():
-        outputs["backbones"] = list(backbones_dir.glob("*.pdb"))
-
-    if packed_dir.exists():
-        outputs["packed"] = list(packed_dir.glob("*.pdb"))
+    output_dir_for = _DESIGN_OUTPUT_DIRS.get
+    try:
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                bucket = output_dir_for(entry.name)
+                if bucket and entry.is_dir():
+                    key, suffix = bucket
+                    outputs[key] = _scan_files(entry.path, suffix)
+    except FileNotFoundError:
+        pass
 
     outputs["metadata"] = {
         "total_sequences": len(outputs["sequences"]),
@@ -160,14 +208,71 @@ def collect_scoring_outputs(output_file: Path) -> Dict[str, Any]:
         "metadata": {}
     }
 
-    if output_file.exists():
-        outputs["score_file"] = str(output_file)
-        outputs["score_size"] = output_file.stat().st_size
+    output_str = str(output_file)
+    try:
+        size = os.stat(output_str).st_size
+        exists = True
+    except FileNotFoundError:
+        size = 0
+        exists = False
+
+    if exists:
+        outputs["score_file"] = output_str
+        outputs["score_size"] = size
 
     outputs["metadata"] = {
-        "output_file": str(output_file),
-        "file_exists": output_file.exists(),
-        "file_size_bytes": outputs["score_size"]
+        "output_file": output_str,
+        "file_exists": exists,
+        "file_size_bytes": size
     }
 
-    return outputs
\ No newline at end of file
+    return outputs
+
+
+# HETATM residue names that are solvent rather than ligands
+_SOLVENT_RESIDUES = frozenset({b"HOH", b"WAT", b"DOD"})
+
+
+def load_structure_info(pdb_file: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Summarize a PDB file from its ATOM/HETATM records.
+
+    Args:
+        pdb_file: Path to PDB file
+
+    Returns:
+        Dict with chains (in file order), num_residues, has_ligands,
+        ligands (residue names) and num_atoms
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    chains: Dict[str, None] = {}
+    residues = set()
+    ligands: Dict[str, None] = {}
+    num_atoms = 0
+
+    with open(pdb_file, "rb") as f:
+        for line in f:
+            record = line[:6]
+            if record == b"ATOM  ":
+                num_atoms += 1
+                chain = line[21:22].decode("ascii", "replace").strip()
+                chains.setdefault(chain)
+                # chain + residue number + insertion code
+                residues.add(line[21:27])
+            elif record == b"HETATM":
+                num_atoms += 1
+                resname = line[17:20].strip()
+                if resname not in _SOLVENT_RESIDUES:
+                    ligands.setdefault(resname.decode("ascii", "replace"))
+            elif record == b"ENDMDL":
+                break  # only the first model
+
+    return {
+        "chains": list(chains),
+        "num_residues": len(residues),
+        "has_ligands": bool(ligands),
+        "ligands": list(ligands),
+        "num_atoms": num_atoms,
+    }
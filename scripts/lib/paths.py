@@ -5,9 +5,17 @@ Centralizes path management to make scripts more portable
 and easier to maintain.
 """
 
+import functools
 from pathlib import Path
 from typing import Dict, Union
 
+# model_type -> key in paths["models"]
+_MODEL_KEY = {
+    "protein_mpnn": "proteinmpnn",
+    "ligand_mpnn": "ligandmpnn",
+    "soluble_mpnn": "solublempnn",
+}
+
 
 def setup_paths(script_path: Path) -> Dict[str, Union[Path, Dict[str, Path]]]:
     """
@@ -19,7 +27,10 @@ def setup_paths(script_path: Path) -> Dict[str, Union[Path, Dict[str, Path]]]:
     Returns:
         Dict containing all standard paths
     """
-    script_dir = Path(script_path).parent
+    return _paths_for_scripts_dir(Path(script_path).parent)
+
+
+def _paths_for_scripts_dir(script_dir: Path) -> Dict[str, Union[Path, Dict[str, Path]]]:
     mcp_root = script_dir.parent
 
     return {
@@ -39,8 +50,44 @@ def setup_paths(script_path: Path) -> Dict[str, Union[Path, Dict[str, Path]]]:
     }
 
 
-# Standard paths for use in scripts
-PATHS = setup_paths(__file__)
+@functools.cache
+def get_paths() -> Dict[str, Union[Path, Dict[str, Path]]]:
+    """
+    Get the standard paths for use in scripts, built on first call.
+
+    Returns:
+        Dict containing all standard paths (shared, do not mutate)
+    """
+    # This module lives in scripts/lib/, so the scripts directory is two levels up
+    return _paths_for_scripts_dir(Path(__file__).parent.parent)
+
+
+@functools.cache
+def get_model_path_strings() -> Dict[str, str]:
+    """
+    Get the model checkpoint paths as strings, converted on first call.
+
+    Returns:
+        Dict mapping model key to checkpoint path string (shared, do not mutate)
+    """
+    return {name: str(path) for name, path in get_paths()["models"].items()}
+
+
+def __getattr__(name: str):
+    # PATHS and MODEL_PATH_STRINGS are lazy aliases for existing imports
+    if name == "PATHS":
+        return get_paths()
+    if name == "MODEL_PATH_STRINGS":
+        return get_model_path_strings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.cache
+def _default_model_path(model_type: str) -> Path:
+    try:
+        return get_paths()["models"][_MODEL_KEY[model_type]]
+    except KeyError:
+        raise ValueError(f"Unknown model type: {model_type}") from None
 
 
 def get_model_path(model_type: str, paths: Dict[str, Union[Path, Dict[str, Path]]] = None) -> Path:
@@ -58,18 +105,11 @@ def get_model_path(model_type: str, paths: Dict[str, Union[Path, Dict[str, Path]
         ValueError: If model type is not recognized
     """
     if paths is None:
-        paths = PATHS
-
-    models = paths["models"]
+        return _default_model_path(model_type)
 
-    if model_type == "protein_mpnn":
-        return models["proteinmpnn"]
-    elif model_type == "ligand_mpnn":
-        return models["ligandmpnn"]
-    elif model_type == "soluble_mpnn":
-        return models["solublempnn"]
-    else:
+    if model_type not in _MODEL_KEY:
         raise ValueError(f"Unknown model type: {model_type}")
+    return paths["models"][_MODEL_KEY[model_type]]
 
 
 def get_config_path(config_name: str, paths: Dict[str, Union[Path, Dict[str, Path]]] = None) -> Path:
@@ -84,7 +124,7 @@ def get_config_path(config_name: str, paths: Dict[str, Union[Path, Dict[str, Pat
         Path to config file
     """
     if paths is None:
-        paths = PATHS
+        paths = get_paths()
 
     return paths["configs"] / f"{config_name}.json"
 
@@ -101,7 +141,7 @@ def get_results_path(subdir: str = None, paths: Dict[str, Union[Path, Dict[str,
         Path to results directory
     """
     if paths is None:
-        paths = PATHS
+        paths = get_paths()
 
     base = paths["results"]
     return base / subdir if subdir else base
@@ -5,34 +5,107 @@ Handles lazy loading and interface to the LigandMPNN repository
 to minimize startup time and isolate repo dependencies.
 """
 
+import functools
+import importlib
+import importlib.util
 import sys
+from dataclasses import dataclass, fields
 from pathlib import Path
+from types import ModuleType
 from typing import Dict, Any, Optional, List, Callable
 
-from .paths import PATHS
+from .paths import get_model_path_strings, get_paths
 
+# Resolved repo entry points, keyed by module name
+_REPO_MAINS: Dict[str, Callable] = {}
 
-def get_repo_runner() -> Callable:
+
+def _lazy_import(module_name: str) -> ModuleType:
     """
-    Lazy load repo run module to minimize startup time.
+    Register module_name in sys.modules without executing it yet.
+
+    The module body (and with it torch) only runs on first attribute access.
+
+    Raises:
+        ImportError: If the module can't be found
+    """
+    spec = importlib.util.find_spec(module_name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No module named {module_name!r}")
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _load_repo_main(module_name: str) -> Callable:
+    """
+    Get the main function of a repo module, resolved once per process.
+
+    If the module has not been imported yet it is registered lazily: the
+    returned function executes the module (and imports torch) on its first
+    call, not here. The repo path is added to sys.path at most once.
+
+    Args:
+        module_name: Repo module name ('run' or 'score')
 
     Returns:
-        The run.main function from repo
+        The module's main function (or a deferring wrapper around it)
 
     Raises:
         FileNotFoundError: If repository not found
-        ImportError: If run module can't be imported
+        ImportError: If the module can't be found; errors raised while
+            executing it surface from the first call instead
     """
-    repo_path = PATHS["repo"]
+    repo_main = _REPO_MAINS.get(module_name)
+    if repo_main is not None:
+        return repo_main
+
+    module = sys.modules.get(module_name)
+    if module is not None:
+        repo_main = _REPO_MAINS[module_name] = module.main
+        return repo_main
+
+    repo_path = get_paths()["repo"]
     if not repo_path.exists():
         raise FileNotFoundError(f"Repository not found at {repo_path}")
 
-    sys.path.insert(0, str(repo_path))
+    repo_str = str(repo_path)
+    if repo_str not in sys.path:
+        sys.path.insert(0, repo_str)
     try:
-        from run import main as run_main
-        return run_main
+        module = _lazy_import(module_name)
     except ImportError as e:
-        raise ImportError(f"Failed to import repo run module: {e}")
+        raise ImportError(f"Failed to import repo {module_name} module: {e}")
+
+    def repo_main(args):
+        try:
+            main = module.main
+        except BaseException:
+            # Module body failed; drop the half-initialised module so a retry re-imports it
+            sys.modules.pop(module_name, None)
+            _REPO_MAINS.pop(module_name, None)
+            raise
+        _REPO_MAINS[module_name] = main
+        return main(args)
+
+    _REPO_MAINS[module_name] = repo_main
+    return repo_main
+
+
+def get_repo_runner() -> Callable:
+    """
+    Lazy load repo run module to minimize startup time.
+
+    Returns:
+        The run.main function from repo
+
+    Raises:
+        FileNotFoundError: If repository not found
+        ImportError: If run module can't be imported
+    """
+    return _load_repo_main("run")
 
 
 def get_repo_scorer() -> Callable:
@@ -46,16 +119,108 @@ def get_repo_scorer() -> Callable:
         FileNotFoundError: If repository not found
         ImportError: If score module can't be imported
     """
-    repo_path = PATHS["repo"]
-    if not repo_path.exists():
-        raise FileNotFoundError(f"Repository not found at {repo_path}")
-
-    sys.path.insert(0, str(repo_path))
-    try:
-        from score import main as score_main
-        return score_main
-    except ImportError as e:
-        raise ImportError(f"Failed to import repo score module: {e}")
+    return _load_repo_main("score")
+
+
+@dataclass(slots=True)
+class Args:
+    """Argument namespace passed to the repo's run.main / score.main."""
+    # Basic parameters
+    seed: int = 111
+    pdb_path: str = ""
+    out_folder: str = ""
+    verbose: int = 1
+    model_type: str = "ligand_mpnn"
+
+    # Model checkpoints
+    checkpoint_protein_mpnn: str = ""
+    checkpoint_ligand_mpnn: str = ""
+    checkpoint_soluble_mpnn: str = ""
+    checkpoint_global_label_membrane_mpnn: str = ""
+    checkpoint_per_residue_label_membrane_mpnn: str = ""
+
+    # Ligand context parameters
+    ligand_mpnn_use_atom_context: int = 1
+    ligand_mpnn_use_side_chain_context: int = 0
+    ligand_mpnn_cutoff_for_score: float = 8.0
+
+    # Processing parameters
+    batch_size: int = 1
+    number_of_batches: int = 1
+
+    # Design-specific parameters
+    temperature: float = 0.1
+    save_stats: int = 0
+
+    # Scoring-specific parameters
+    autoregressive_score: int = 0
+    use_sequence: int = 1
+    single_aa_score: int = 1
+    fasta_seq: str = ""
+
+    # Constraint parameters
+    fixed_residues: str = ""
+    redesigned_residues: str = ""
+    omit_AA: str = ""
+    bias_AA: str = ""
+    chains_to_design: str = ""
+    parse_these_chains_only: str = ""
+    bias_AA_per_residue: str = ""
+    omit_AA_per_residue: str = ""
+    symmetry_residues: str = ""
+    symmetry_weights: str = ""
+
+    # Packing parameters
+    pack_side_chains: int = 0
+    pack_with_ligand_context: int = 0
+    repack_everything: int = 0
+    number_of_packs_per_design: int = 0
+    checkpoint_path_sc: str = ""
+
+    # Membrane parameters
+    global_transmembrane_label: int = 0
+    transmembrane_buried: str = ""
+    transmembrane_interface: str = ""
+
+    # Advanced parameters
+    homo_oligomer: int = 0
+    file_ending: str = ""
+    zero_indexed: int = 0
+    parse_atoms_with_zero_occupancy: int = 0
+    fasta_seq_separation: str = ":"
+
+    # Multi-structure parameters
+    pdb_path_multi: str = ""
+    fixed_residues_multi: str = ""
+    redesigned_residues_multi: str = ""
+    omit_AA_per_residue_multi: str = ""
+    bias_AA_per_residue_multi: str = ""
+
+
+# Config keys that map onto Args fields; the rest are derived per call
+_CONFIG_FIELDS = frozenset(f.name for f in fields(Args)) - {
+    "pdb_path",
+    "out_folder",
+    "fasta_seq",
+    "checkpoint_protein_mpnn",
+    "checkpoint_ligand_mpnn",
+    "checkpoint_soluble_mpnn",
+    "checkpoint_global_label_membrane_mpnn",
+    "checkpoint_per_residue_label_membrane_mpnn",
+}
+
+
+@functools.cache
+def _checkpoint_args() -> Dict[str, str]:
+    """Checkpoint path strings for Args, keyed by Args field name."""
+    models = get_model_path_strings()
+    return {
+        "checkpoint_protein_mpnn": models["proteinmpnn"],
+        "checkpoint_ligand_mpnn": models["ligandmpnn"],
+        "checkpoint_soluble_mpnn": models["solublempnn"],
+        "checkpoint_global_label_membrane_mpnn": models["global_label_membrane"],
+        "checkpoint_per_residue_label_membrane_mpnn": models["per_residue_label_membrane"],
+    }
 
 
 def create_base_args(
@@ -63,7 +228,7 @@ def create_base_args(
     output_location: Path,
     config: Dict[str, Any],
     is_scoring: bool = False
-) -> object:
+) -> Args:
     """
     Create base Args object with common parameters.
 
@@ -76,87 +241,14 @@ def create_base_args(
     Returns:
         Args object ready for repo functions
     """
-    class Args:
-        def __init__(self):
-            # Basic parameters
-            self.seed = config.get("seed", 111)
-            self.pdb_path = str(input_pdb)
-            self.verbose = config.get("verbose", 1)
-            self.model_type = config.get("model_type", "ligand_mpnn")
-
-            # Output handling
-            if is_scoring:
-                self.out_folder = str(output_location.parent)
-            else:
-                self.out_folder = str(output_location)
-
-            # Model checkpoints
-            models = PATHS["models"]
-            self.checkpoint_protein_mpnn = str(models["proteinmpnn"])
-            self.checkpoint_ligand_mpnn = str(models["ligandmpnn"])
-            self.checkpoint_soluble_mpnn = str(models["solublempnn"])
-            self.checkpoint_global_label_membrane_mpnn = str(models["global_label_membrane"])
-            self.checkpoint_per_residue_label_membrane_mpnn = str(models["per_residue_label_membrane"])
-
-            # Ligand context parameters
-            self.ligand_mpnn_use_atom_context = config.get("ligand_mpnn_use_atom_context", 1)
-            self.ligand_mpnn_use_side_chain_context = config.get("ligand_mpnn_use_side_chain_context", 0)
-            self.ligand_mpnn_cutoff_for_score = config.get("ligand_mpnn_cutoff_for_score", 8.0)
-
-            # Processing parameters
-            self.batch_size = config.get("batch_size", 1)
-            self.number_of_batches = config.get("number_of_batches", 1)
-
-            # Design-specific parameters (not used in scoring)
-            if not is_scoring:
-                self.temperature = config.get("temperature", 0.1)
-                self.save_stats = config.get("save_stats", 0)
-
-            # Scoring-specific parameters
-            if is_scoring:
-                self.autoregressive_score = config.get("autoregressive_score", 0)
-                self.use_sequence = config.get("use_sequence", 1)
-                self.single_aa_score = config.get("single_aa_score", 1)
-
-            # Constraint parameters
-            self.fixed_residues = config.get("fixed_residues", "")
-            self.redesigned_residues = config.get("redesigned_residues", "")
-            self.omit_AA = config.get("omit_AA", "")
-            self.bias_AA = config.get("bias_AA", "")
-            self.chains_to_design = config.get("chains_to_design", "")
-            self.parse_these_chains_only = config.get("parse_these_chains_only", "")
-            self.bias_AA_per_residue = config.get("bias_AA_per_residue", "")
-            self.omit_AA_per_residue = config.get("omit_AA_per_residue", "")
-            self.symmetry_residues = config.get("symmetry_residues", "")
-            self.symmetry_weights = config.get("symmetry_weights", "")
-
-            # Packing parameters
-            self.pack_side_chains = config.get("pack_side_chains", 0)
-            self.pack_with_ligand_context = config.get("pack_with_ligand_context", 0)
-            self.repack_everything = config.get("repack_everything", 0)
-            self.number_of_packs_per_design = config.get("number_of_packs_per_design", 0)
-            self.checkpoint_path_sc = config.get("checkpoint_path_sc", "")
-
-            # Membrane parameters
-            self.global_transmembrane_label = config.get("global_transmembrane_label", 0)
-            self.transmembrane_buried = config.get("transmembrane_buried", "")
-            self.transmembrane_interface = config.get("transmembrane_interface", "")
-
-            # Advanced parameters
-            self.homo_oligomer = config.get("homo_oligomer", 0)
-            self.file_ending = config.get("file_ending", "")
-            self.zero_indexed = config.get("zero_indexed", 0)
-            self.parse_atoms_with_zero_occupancy = config.get("parse_atoms_with_zero_occupancy", 0)
-            self.fasta_seq_separation = config.get("fasta_seq_separation", ":")
-
-            # Multi-structure parameters
-            self.pdb_path_multi = config.get("pdb_path_multi", "")
-            self.fixed_residues_multi = config.get("fixed_residues_multi", "")
-            self.redesigned_residues_multi = config.get("redesigned_residues_multi", "")
-            self.omit_AA_per_residue_multi = config.get("omit_AA_per_residue_multi", "")
-            self.bias_AA_per_residue_multi = config.get("bias_AA_per_residue_multi", "")
-
-    return Args()
+    overrides = {key: value for key, value in config.items() if key in _CONFIG_FIELDS}
+    out_folder = output_location.parent if is_scoring else output_location
+    return Args(
+        pdb_path=str(input_pdb),
+        out_folder=str(out_folder),
+        **_checkpoint_args(),
+        **overrides,
+    )
 
 
 def add_sequence_to_args(args: object, sequences: List[str]) -> None:
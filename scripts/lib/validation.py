@@ -5,26 +5,45 @@ Provides consistent validation across all scripts
 to ensure proper input formats and file existence.
 """
 
+import os
+import re
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
 
+# Deletes every valid amino acid (either case); whatever survives is invalid
+_VALID_AA = "ACDEFGHIKLMNPQRSTVWY"
+_STRIP_VALID_AA = str.maketrans("", "", _VALID_AA + _VALID_AA.lower())
 
-def validate_pdb_file(file_path: Path) -> None:
+# Residue identifier: an ASCII chain letter followed by at least one character
+_RESIDUE_RE = re.compile(r"[A-Za-z].+", re.DOTALL)
+
+_VALID_MODELS = frozenset({"protein_mpnn", "ligand_mpnn", "soluble_mpnn"})
+
+
+def validate_pdb_file(file_path: Union[str, os.PathLike]) -> os.stat_result:
     """
     Validate PDB file exists and has correct extension.
 
     Args:
-        file_path: Path to PDB file
+        file_path: Path to PDB file (str or path-like; not wrapped in Path)
+
+    Returns:
+        The file's stat result, for callers that need its size or mtime
 
     Raises:
         FileNotFoundError: If file doesn't exist
         ValueError: If file doesn't have .pdb extension
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"PDB file not found: {file_path}")
+    name = os.fspath(file_path)
+    try:
+        st = os.stat(name)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"PDB file not found: {file_path}") from None
+
+    if not name.lower().endswith('.pdb'):
+        raise ValueError(f"Input file must be a PDB file, got: {os.path.splitext(name)[1]}")
 
-    if not file_path.suffix.lower() == '.pdb':
-        raise ValueError(f"Input file must be a PDB file, got: {file_path.suffix}")
+    return st
 
 
 def validate_inputs(input_file: Path) -> None:
@@ -59,10 +78,9 @@ def validate_sequences(sequences: Optional[List[str]]) -> None:
             raise ValueError(f"Sequence {i+1} is empty")
 
         # Basic protein sequence validation
-        valid_amino_acids = set("ACDEFGHIKLMNPQRSTVWY")
-        invalid_chars = set(seq.upper()) - valid_amino_acids
-        if invalid_chars:
-            raise ValueError(f"Sequence {i+1} contains invalid amino acids: {invalid_chars}")
+        invalid = seq.translate(_STRIP_VALID_AA)
+        if invalid:
+            raise ValueError(f"Sequence {i+1} contains invalid amino acids: {set(invalid.upper())}")
 
 
 def validate_model_type(model_type: str) -> None:
@@ -75,9 +93,8 @@ def validate_model_type(model_type: str) -> None:
     Raises:
         ValueError: If model type is not supported
     """
-    valid_models = {"protein_mpnn", "ligand_mpnn", "soluble_mpnn"}
-    if model_type not in valid_models:
-        raise ValueError(f"Invalid model type: {model_type}. Must be one of {valid_models}")
+    if model_type not in _VALID_MODELS:
+        raise ValueError(f"Invalid model type: {model_type}. Must be one of {sorted(_VALID_MODELS)}")
 
 
 def validate_temperature(temperature: float) -> None:
@@ -125,10 +142,11 @@ def validate_residue_list(residue_list: List[str], context: str = "residues") ->
     if not residue_list:
         return  # Empty list is valid
 
-    for residue in residue_list:
-        if not residue:
-            raise ValueError(f"Empty {context} identifier found")
-
-        # Basic format check - should start with chain letter
-        if len(residue) < 2 or not residue[0].isalpha():
-            raise ValueError(f"Invalid {context} identifier: {residue}. Expected format like 'C1', 'A25', etc.")
\ No newline at end of file
+    # Basic format check - should start with chain letter
+    fullmatch = _RESIDUE_RE.fullmatch
+    bad = next((residue for residue in residue_list if not fullmatch(residue)), None)
+    if bad is None:
+        return
+    if not bad:
+        raise ValueError(f"Empty {context} identifier found")
+    raise ValueError(f"Invalid {context} identifier: {bad}. Expected format like 'C1', 'A25', etc.")
\ No newline at end of file
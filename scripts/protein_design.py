@@ -16,17 +16,19 @@ Example:
 # ==============================================================================
 # Minimal Imports (only essential packages)
 # ==============================================================================
-import argparse
+import functools
+import hashlib
 import os
-import sys
-import json
 from pathlib import Path
-from typing import Union, Optional, Dict, Any
+from types import MappingProxyType
+from typing import Union, Optional, Dict, Any, Mapping
+
+from lib.repo_interface import create_base_args, get_repo_runner
 
 # ==============================================================================
 # Configuration (extracted from use case)
 # ==============================================================================
-DEFAULT_CONFIG = {
+DEFAULT_CONFIG = MappingProxyType({
     "seed": 111,
     "temperature": 0.1,
     "model_type": "protein_mpnn",
@@ -44,42 +46,23 @@ DEFAULT_CONFIG = {
     "homo_oligomer": 0,
     "zero_indexed": 0,
     "parse_atoms_with_zero_occupancy": 0
-}
+})
+
+def merge_config(config: Optional[Mapping[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+    """Merge config and overrides onto DEFAULT_CONFIG."""
+    return {**DEFAULT_CONFIG, **(config or {}), **kwargs}
 
 # ==============================================================================
 # Path Configuration
 # ==============================================================================
 SCRIPT_DIR = Path(__file__).parent
-MCP_ROOT = SCRIPT_DIR.parent
-
-PATHS = {
-    "repo": MCP_ROOT / "repo" / "LigandMPNN",
-    "models": {
-        "proteinmpnn": MCP_ROOT / "repo" / "LigandMPNN" / "model_params" / "proteinmpnn_v_48_020.pt",
-        "ligandmpnn": MCP_ROOT / "repo" / "LigandMPNN" / "model_params" / "ligandmpnn_v_32_020_25.pt",
-        "solublempnn": MCP_ROOT / "repo" / "LigandMPNN" / "model_params" / "solublempnn_v_48_020.pt",
-        "global_label_membrane": MCP_ROOT / "repo" / "LigandMPNN" / "model_params" / "global_label_membrane_mpnn_v_48_020.pt",
-        "per_residue_label_membrane": MCP_ROOT / "repo" / "LigandMPNN" / "model_params" / "per_residue_label_membrane_mpnn_v_48_020.pt"
-    },
-    "examples_data": MCP_ROOT / "examples" / "data"
-}
+
+# Written to the output directory after a successful run; holds that run's key
+RUN_KEY_FILE = ".mcp_run_key"
 
 # ==============================================================================
 # Repository Interface Functions
 # ==============================================================================
-def get_repo_runner():
-    """Lazy load repo run module to minimize startup time."""
-    repo_path = PATHS["repo"]
-    if not repo_path.exists():
-        raise FileNotFoundError(f"Repository not found at {repo_path}")
-
-    sys.path.insert(0, str(repo_path))
-    try:
-        from run import main as run_main
-        return run_main
-    except ImportError as e:
-        raise ImportError(f"Failed to import repo run module: {e}")
-
 def create_args_object(
     input_pdb: Path,
     output_dir: Path,
@@ -87,110 +70,81 @@ def create_args_object(
     config: Optional[Dict[str, Any]] = None
 ):
     """Create Args object for repo function call."""
-    config = {**DEFAULT_CONFIG, **(config or {})}
-
-    class Args:
-        def __init__(self):
-            # Basic parameters
-            self.seed = config["seed"]
-            self.pdb_path = str(input_pdb)
-            self.out_folder = str(output_dir)
-            self.temperature = config["temperature"]
-            self.model_type = config["model_type"]
-            self.batch_size = config["batch_size"]
-            self.number_of_batches = num_sequences
-            self.verbose = config["verbose"]
-            self.save_stats = config["save_stats"]
-
-            # Model checkpoints
-            self.checkpoint_protein_mpnn = str(PATHS["models"]["proteinmpnn"])
-            self.checkpoint_ligand_mpnn = str(PATHS["models"]["ligandmpnn"])
-            self.checkpoint_soluble_mpnn = str(PATHS["models"]["solublempnn"])
-            self.checkpoint_global_label_membrane_mpnn = str(PATHS["models"]["global_label_membrane"])
-            self.checkpoint_per_residue_label_membrane_mpnn = str(PATHS["models"]["per_residue_label_membrane"])
-
-            # Default empty/zero parameters
-            self.fixed_residues = ""
-            self.redesigned_residues = ""
-            self.omit_AA = ""
-            self.bias_AA = ""
-            self.chains_to_design = ""
-            self.parse_these_chains_only = ""
-            self.bias_AA_per_residue = ""
-            self.omit_AA_per_residue = ""
-            self.symmetry_residues = ""
-            self.symmetry_weights = ""
-            self.homo_oligomer = config["homo_oligomer"]
-            self.file_ending = ""
-            self.zero_indexed = config["zero_indexed"]
-            self.ligand_mpnn_use_atom_context = config["ligand_mpnn_use_atom_context"]
-            self.ligand_mpnn_use_side_chain_context = config["ligand_mpnn_use_side_chain_context"]
-            self.global_transmembrane_label = config["global_transmembrane_label"]
-            self.transmembrane_buried = ""
-            self.transmembrane_interface = ""
-            self.fasta_seq_separation = ":"
-            self.pdb_path_multi = ""
-            self.fixed_residues_multi = ""
-            self.redesigned_residues_multi = ""
-            self.omit_AA_per_residue_multi = ""
-            self.bias_AA_per_residue_multi = ""
-            self.ligand_mpnn_cutoff_for_score = config["ligand_mpnn_cutoff_for_score"]
-            self.pack_side_chains = config["pack_side_chains"]
-            self.pack_with_ligand_context = config["pack_with_ligand_context"]
-            self.repack_everything = config["repack_everything"]
-            self.number_of_packs_per_design = config["number_of_packs_per_design"]
-            self.checkpoint_path_sc = ""
-            self.parse_atoms_with_zero_occupancy = config["parse_atoms_with_zero_occupancy"]
-
-    return Args()
+    return create_base_args(input_pdb, output_dir, {**merge_config(config), "number_of_batches": num_sequences})
 
 # ==============================================================================
 # Utility Functions
 # ==============================================================================
 def load_config(config_file: Path) -> dict:
-    """Load configuration from JSON file."""
-    with open(config_file) as f:
-        return json.load(f)
+    """Load configuration from JSON file (parsed with orjson when available)."""
+    from lib.io import load_config as _load_config
 
-def validate_inputs(input_file: Path) -> None:
-    """Validate input files exist."""
-    if not input_file.exists():
-        raise FileNotFoundError(f"Input file not found: {input_file}")
+    return _load_config(config_file)
 
-    if not input_file.suffix.lower() == '.pdb':
-        raise ValueError(f"Input file must be a PDB file, got: {input_file.suffix}")
+def validate_inputs(input_file: Union[str, Path]) -> os.stat_result:
+    """Validate input files exist; returns the input's stat result."""
+    from lib.validation import validate_pdb_file
+
+    return validate_pdb_file(input_file)
 
 def collect_outputs(output_dir: Path) -> Dict[str, Any]:
     """Collect generated output files and metadata."""
-    outputs = {
-        "sequences": [],
-        "backbones": [],
-        "packed": [],
-        "metadata": {}
-    }
+    from lib.io import collect_design_outputs
 
-    # Look for output directories
-    seqs_dir = output_dir / "seqs"
-    backbones_dir = output_dir / "backbones"
-    packed_dir = output_dir / "packed"
+    return collect_design_outputs(output_dir)
 
-    if seqs_dir.exists():
-        outputs["sequences"] = list(seqs_dir.glob("*.fa"))
+def run_key(input_file: Path, st: os.stat_result, config: Mapping[str, Any], num_sequences: int) -> str:
+    """Key identifying a design run: the input file's identity and mtime (from st), the config and count."""
+    import json
 
-    if backbones_dir.exists():
-        outputs["backbones"] = list(backbones_dir.glob("*.pdb"))
+    ident = {
+        "input": str(input_file.resolve()),
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "config": dict(config),
+        "num_sequences": num_sequences,
+    }
+    canonical = json.dumps(ident, sort_keys=True, separators=(",", ":"), default=repr)
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
 
-    if packed_dir.exists():
-        outputs["packed"] = list(packed_dir.glob("*.pdb"))
+def read_run_key(output_dir: Path) -> Optional[str]:
+    """Return the key of the last successful run in output_dir, if any."""
+    try:
+        return (output_dir / RUN_KEY_FILE).read_text()
+    except OSError:
+        return None
 
-    outputs["metadata"] = {
-        "total_sequences": len(outputs["sequences"]),
-        "output_dir": str(output_dir),
-        "has_backbones": len(outputs["backbones"]) > 0,
-        "has_packed": len(outputs["packed"]) > 0
-    }
+def reusable_outputs(
+    output_dir: Path,
+    input_file: Path,
+    config: Mapping[str, Any],
+    num_sequences: int
+) -> Optional[Dict[str, Any]]:
+    """
+    Collect the outputs of the run recorded in output_dir, if they are intact.
+
+    Returns None when the input's FASTA or any of its backbones is missing,
+    or when an output was modified after the run key was written.
+    """
+    result = collect_outputs(output_dir)
+    name = input_file.stem + config.get("file_ending", "")
+    expected_fasta = os.path.join(os.fspath(output_dir), "seqs", f"{name}.fa")
+    if expected_fasta not in result["sequences"]:
+        return None
 
-    return outputs
+    prefix = f"{name}_"
+    backbones = [path for path in result["backbones"] if os.path.basename(path).startswith(prefix)]
+    if len(backbones) < config.get("batch_size", 1) * num_sequences:
+        return None
+
+    try:
+        written = os.stat(output_dir / RUN_KEY_FILE).st_mtime_ns
+        for path in (expected_fasta, *backbones):
+            if os.stat(path).st_mtime_ns > written:
+                return None
+    except FileNotFoundError:
+        return None
+    return result
 
 # ==============================================================================
 # Core Function (main logic extracted from use case)
@@ -225,7 +179,7 @@ def run_protein_design(
     """
     # Setup
     input_file = Path(input_file)
-    config = {**DEFAULT_CONFIG, **(config or {}), **kwargs}
+    config = merge_config(config, **kwargs)
 
     # Set output directory
     if output_file:
@@ -236,23 +190,38 @@ def run_protein_design(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Validate inputs
-    validate_inputs(input_file)
-
-    # Create args and get repo runner
-    args = create_args_object(input_file, output_dir, num_sequences, config)
-    run_main = get_repo_runner()
+    st = validate_inputs(input_file)
+
+    # An identical run that already completed here can reuse its outputs,
+    # as long as they are all still present and untouched
+    key = run_key(input_file, st, config, num_sequences)
+    key_file = output_dir / RUN_KEY_FILE
+    result = None
+    if read_run_key(output_dir) == key:
+        result = reusable_outputs(output_dir, input_file, config, num_sequences)
+    reuse = result is not None
+
+    if not reuse:
+        # Create args and get repo runner
+        args = create_args_object(input_file, output_dir, num_sequences, config)
+        run_main = get_repo_runner()
 
     try:
-        # Run protein design
-        print(f"Running ProteinMPNN design on {input_file}")
-        print(f"Model type: {config['model_type']}")
-        print(f"Output directory: {output_dir}")
-        print(f"Generating {num_sequences} sequences with temperature {config['temperature']}")
-
-        run_main(args)
-
-        # Collect outputs
-        result = collect_outputs(output_dir)
+        if reuse:
+            print(f"Reusing outputs in {output_dir} from an identical previous run")
+        else:
+            # Run protein design
+            print(f"Running ProteinMPNN design on {input_file}")
+            print(f"Model type: {config['model_type']}")
+            print(f"Output directory: {output_dir}")
+            print(f"Generating {num_sequences} sequences with temperature {config['temperature']}")
+
+            key_file.unlink(missing_ok=True)
+            run_main(args)
+            key_file.write_text(key)
+
+            # Collect outputs
+            result = collect_outputs(output_dir)
 
         print(f"✅ Design completed successfully!")
         print(f"Generated {result['metadata']['total_sequences']} sequence files")
@@ -263,7 +232,7 @@ def run_protein_design(
             "success": True,
             "metadata": {
                 "input_file": str(input_file),
-                "config": config,
+                "config": dict(config),
                 "num_sequences": num_sequences,
                 **result["metadata"]
             }
@@ -277,7 +246,7 @@ def run_protein_design(
             "success": False,
             "metadata": {
                 "input_file": str(input_file),
-                "config": config,
+                "config": dict(config),
                 "error": str(e)
             }
         }
@@ -285,7 +254,11 @@ def run_protein_design(
 # ==============================================================================
 # CLI Interface
 # ==============================================================================
-def main():
+@functools.lru_cache(maxsize=None)
+def _build_parser():
+    """Build the CLI parser once per process."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description=__doc__,
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -300,8 +273,11 @@ def main():
     parser.add_argument('--model_type', choices=['protein_mpnn', 'ligand_mpnn', 'soluble_mpnn'],
                        help='Model type (overrides config)')
     parser.add_argument('--seed', type=int, help='Random seed (overrides config)')
+    return parser
+
 
-    args = parser.parse_args()
+def main():
+    args = _build_parser().parse_args()
 
     # Load config if provided
     config = None
@@ -16,13 +16,13 @@ Example:
 # ==============================================================================
 # Minimal Imports (only essential packages)
 # ==============================================================================
-import argparse
+import functools
 import os
-import sys
-import json
 from pathlib import Path
 from typing import Union, Optional, Dict, Any, List
 
+from lib.repo_interface import add_sequence_to_args, create_base_args, get_repo_scorer
+
 # ==============================================================================
 # Configuration (extracted from use case)
 # ==============================================================================
@@ -47,36 +47,10 @@ DEFAULT_CONFIG = {
 # Path Configuration
 # ==============================================================================
 SCRIPT_DIR = Path(__file__).parent
-MCP_ROOT = SCRIPT_DIR.parent
-
-PATHS = {
-    "repo": MCP_ROOT / "repo" / "LigandMPNN",
-    "models": {
-        "proteinmpnn": MCP_ROOT / "repo" / "LigandMPNN" / "model_params" / "proteinmpnn_v_48_020.pt",
-        "ligandmpnn": MCP_ROOT / "repo" / "LigandMPNN" / "model_params" / "ligandmpnn_v_32_020_25.pt",
-        "solublempnn": MCP_ROOT / "repo" / "LigandMPNN" / "model_params" / "solublempnn_v_48_020.pt",
-        "global_label_membrane": MCP_ROOT / "repo" / "LigandMPNN" / "model_params" / "global_label_membrane_mpnn_v_48_020.pt",
-        "per_residue_label_membrane": MCP_ROOT / "repo" / "LigandMPNN" / "model_params" / "per_residue_label_membrane_mpnn_v_48_020.pt"
-    },
-    "examples_data": MCP_ROOT / "examples" / "data"
-}
 
 # ==============================================================================
 # Repository Interface Functions
 # ==============================================================================
-def get_repo_scorer():
-    """Lazy load repo score module to minimize startup time."""
-    repo_path = PATHS["repo"]
-    if not repo_path.exists():
-        raise FileNotFoundError(f"Repository not found at {repo_path}")
-
-    sys.path.insert(0, str(repo_path))
-    try:
-        from score import main as score_main
-        return score_main
-    except ImportError as e:
-        raise ImportError(f"Failed to import repo score module: {e}")
-
 def create_args_object(
     input_pdb: Path,
     output_file: Path,
@@ -84,109 +58,67 @@ def create_args_object(
     config: Optional[Dict[str, Any]] = None
 ):
     """Create Args object for repo function call."""
-    config = {**DEFAULT_CONFIG, **(config or {})}
-
-    class Args:
-        def __init__(self):
-            # Basic parameters
-            self.seed = config["seed"]
-            self.pdb_path = str(input_pdb)
-            self.out_folder = str(output_file.parent)
-            self.model_type = config["model_type"]
-            self.batch_size = config["batch_size"]
-            self.number_of_batches = config["number_of_batches"]
-            self.verbose = config["verbose"]
-
-            # Model checkpoints
-            self.checkpoint_protein_mpnn = str(PATHS["models"]["proteinmpnn"])
-            self.checkpoint_ligand_mpnn = str(PATHS["models"]["ligandmpnn"])
-            self.checkpoint_soluble_mpnn = str(PATHS["models"]["solublempnn"])
-            self.checkpoint_global_label_membrane_mpnn = str(PATHS["models"]["global_label_membrane"])
-            self.checkpoint_per_residue_label_membrane_mpnn = str(PATHS["models"]["per_residue_label_membrane"])
-
-            # Scoring-specific parameters
-            self.autoregressive_score = config["autoregressive_score"]
-            self.use_sequence = config["use_sequence"]
-            self.single_aa_score = config["single_aa_score"]
-
-            # Sequence to score (if provided)
-            if sequences:
-                self.fasta_seq = sequences[0] if len(sequences) == 1 else "/".join(sequences)
-            else:
-                self.fasta_seq = ""
-
-            # Default empty/zero parameters (required by score.py)
-            self.pdb_path_multi = ""
-            self.fixed_residues = ""
-            self.fixed_residues_multi = ""
-            self.redesigned_residues = ""
-            self.redesigned_residues_multi = ""
-            self.symmetry_residues = ""
-            self.homo_oligomer = config["homo_oligomer"]
-            self.file_ending = ""
-            self.zero_indexed = config["zero_indexed"]
-            self.ligand_mpnn_cutoff_for_score = config["ligand_mpnn_cutoff_for_score"]
-            self.ligand_mpnn_use_atom_context = config["ligand_mpnn_use_atom_context"]
-            self.ligand_mpnn_use_side_chain_context = config["ligand_mpnn_use_side_chain_context"]
-            self.parse_atoms_with_zero_occupancy = config["parse_atoms_with_zero_occupancy"]
-
-            # Additional required parameters for score.py
-            self.chains_to_design = ""
-            self.parse_these_chains_only = ""
-            self.global_transmembrane_label = 0
-            self.transmembrane_buried = ""
-            self.transmembrane_interface = ""
-
-    return Args()
+    args = create_base_args(input_pdb, output_file, {**DEFAULT_CONFIG, **(config or {})}, is_scoring=True)
+    add_sequence_to_args(args, sequences)
+    return args
 
 # ==============================================================================
 # Utility Functions
 # ==============================================================================
 def load_config(config_file: Path) -> dict:
-    """Load configuration from JSON file."""
-    with open(config_file) as f:
-        return json.load(f)
+    """Load configuration from JSON file (parsed with orjson when available)."""
+    from lib.io import load_config as _load_config
+
+    return _load_config(config_file)
 
-def validate_inputs(input_file: Path) -> None:
-    """Validate input files exist."""
-    if not input_file.exists():
-        raise FileNotFoundError(f"Input file not found: {input_file}")
+def validate_inputs(input_file: Union[str, Path]) -> os.stat_result:
+    """Validate input files exist; returns the input's stat result."""
+    from lib.validation import validate_pdb_file
 
-    if not input_file.suffix.lower() == '.pdb':
-        raise ValueError(f"Input file must be a PDB file, got: {input_file.suffix}")
+    return validate_pdb_file(input_file)
+
+# Maps both sequence separators onto one sentinel character
+_SEP_TABLE = str.maketrans({"/": "\x01", ",": "\x01"})
 
 def parse_sequences(sequences_input: str) -> List[str]:
     """Parse sequences from string input."""
     if not sequences_input:
         return []
 
-    # Handle both "/" and "," as separators
-    if "/" in sequences_input:
-        return [seq.strip() for seq in sequences_input.split("/")]
-    elif "," in sequences_input:
-        return [seq.strip() for seq in sequences_input.split(",")]
-    else:
-        return [sequences_input.strip()]
-
-def collect_outputs(output_file: Path) -> Dict[str, Any]:
-    """Collect generated output files and metadata."""
-    outputs = {
-        "score_file": None,
-        "score_size": 0,
-        "metadata": {}
-    }
+    # Handle both "/" and "," as separators in a single pass
+    parts = sequences_input.translate(_SEP_TABLE).split("\x01")
+    return [seq for seq in (part.strip() for part in parts) if seq]
 
-    if output_file.exists():
-        outputs["score_file"] = str(output_file)
-        outputs["score_size"] = output_file.stat().st_size
+def collect_outputs(output_file: Path, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Collect generated output files and metadata.
 
-    outputs["metadata"] = {
-        "output_file": str(output_file),
-        "file_exists": output_file.exists(),
-        "file_size_bytes": outputs["score_size"]
+    If metadata is given, the file fields are also written into it, so a
+    caller's run metadata needs no separate merge.
+    """
+    output_str = str(output_file)
+    try:
+        size = os.stat(output_str).st_size
+        exists = True
+    except FileNotFoundError:
+        size = 0
+        exists = False
+
+    file_metadata = {
+        "output_file": output_str,
+        "file_exists": exists,
+        "file_size_bytes": size
+    }
+    if metadata is not None:
+        metadata["output_file"] = output_str
+        metadata["file_exists"] = exists
+        metadata["file_size_bytes"] = size
+
+    return {
+        "score_file": output_str if exists else None,
+        "score_size": size,
+        "metadata": file_metadata
     }
-
-    return outputs
 
 # ==============================================================================
 # Core Function (main logic extracted from use case)
@@ -265,7 +197,13 @@ def run_sequence_scoring(
         score_main(args)
 
         # Collect outputs
-        result = collect_outputs(output_path)
+        metadata = {
+            "input_file": str(input_file),
+            "config": config,
+            "num_sequences": len(sequences_list),
+            "sequences": sequences_list if len(sequences_list) <= 5 else f"{len(sequences_list)} sequences",
+        }
+        result = collect_outputs(output_path, metadata)
 
         print(f"✅ Scoring completed successfully!")
         print(f"Score file: {output_path} ({result['score_size']} bytes)")
@@ -274,13 +212,7 @@ def run_sequence_scoring(
             "result": result,
             "output_file": str(output_path),
             "success": True,
-            "metadata": {
-                "input_file": str(input_file),
-                "config": config,
-                "num_sequences": len(sequences_list),
-                "sequences": sequences_list if len(sequences_list) <= 5 else f"{len(sequences_list)} sequences",
-                **result["metadata"]
-            }
+            "metadata": metadata
         }
 
     except Exception as e:
@@ -299,7 +231,11 @@ def run_sequence_scoring(
 # ==============================================================================
 # CLI Interface
 # ==============================================================================
-def main():
+@functools.lru_cache(maxsize=None)
+def _build_parser():
+    """Build the CLI parser once per process."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description=__doc__,
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -312,8 +248,11 @@ def main():
     parser.add_argument('--model_type', choices=['protein_mpnn', 'ligand_mpnn', 'soluble_mpnn'],
                        help='Model type (overrides config)')
     parser.add_argument('--seed', type=int, help='Random seed (overrides config)')
+    return parser
 
-    args = parser.parse_args()
+
+def main():
+    args = _build_parser().parse_args()
 
     # Load config if provided
     config = None
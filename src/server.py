@@ -6,11 +6,17 @@ Provides both synchronous and asynchronous (submit) APIs for protein design tool
 Fast operations (< 10 minutes) use sync API, longer operations use submit API.
 """
 
-from fastmcp import FastMCP
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Callable
+import copy
+import fnmatch
+import functools
+import os
 import sys
 import json
+import time
 
 # Setup paths
 SCRIPT_DIR = Path(__file__).parent.resolve()
@@ -19,22 +25,109 @@ SCRIPTS_DIR = MCP_ROOT / "scripts"
 sys.path.insert(0, str(SCRIPT_DIR))
 sys.path.insert(0, str(SCRIPTS_DIR))
 
+# Scripts submitted as background jobs
+_PROTEIN_DESIGN_SCRIPT = str(SCRIPTS_DIR / "protein_design.py")
+
 from jobs.manager import job_manager
+from protein_design import run_protein_design
+from sequence_scoring import run_sequence_scoring
+from constrained_design import run_constrained_design
+from lib.validation import validate_pdb_file
+from lib.io import load_structure_info
+
+
+class _Logger:
+    """Forwards to loguru (or stdlib logging) imported on first use."""
+
+    @functools.cached_property
+    def _logger(self):
+        try:
+            from loguru import logger
+        except ImportError:
+            import logging
+            logger = logging.getLogger(__name__)
+        return logger
+
+    def __getattr__(self, name):
+        return getattr(self._logger, name)
+
+
+logger = _Logger()
+
+# ==============================================================================
+# MCP Server (fastmcp is imported when the server is first needed)
+# ==============================================================================
+_TOOLS: List[Callable] = []
+
 
-try:
-    from loguru import logger
-except ImportError:
-    import logging
-    logger = logging.getLogger(__name__)
+def _tool(fn: Callable) -> Callable:
+    """Record fn to be registered as a tool on the MCP server."""
+    _TOOLS.append(fn)
+    return fn
 
-# Create MCP server
-mcp = FastMCP("LigandMPNN")
+
+@functools.cache
+def _get_mcp():
+    """Create the FastMCP server and register every tool with it."""
+    from fastmcp import FastMCP
+
+    server = FastMCP("LigandMPNN")
+    for fn in _TOOLS:
+        server.tool()(fn)
+    return server
+
+
+def __getattr__(name: str):
+    # `mcp` is created lazily for `from server import mcp` and the fastmcp CLI
+    if name == "mcp":
+        return _get_mcp()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ==============================================================================
 # Job Management Tools (for async operations)
 # ==============================================================================
+# Bumped on every submit/cancel; cached job reads from an older version are stale
+_job_state_version = 0
+
+_JOB_READ_TTL = 0.1
+
 
-@mcp.tool()
+def _bump_job_state() -> None:
+    global _job_state_version
+    _job_state_version += 1
+
+
+def _ttl_cache(ttl: float) -> Callable:
+    """
+    Cache a job read tool's result for ttl seconds, or until the next submit/cancel.
+
+    Each caller gets its own shallow copy of the cached dict, and error
+    results (e.g. an unknown job_id) are never cached.
+    """
+    def decorator(fn: Callable) -> Callable:
+        cache: Dict[tuple, tuple] = {}
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            now = time.monotonic()
+            key = (args, tuple(sorted(kwargs.items())))
+            hit = cache.get(key)
+            if hit is not None and hit[0] == _job_state_version and hit[1] > now:
+                return dict(hit[2])
+            result = fn(*args, **kwargs)
+            if not isinstance(result, dict) or result.get("status") == "error":
+                return result
+            if len(cache) >= 256:
+                cache.clear()
+            cache[key] = (_job_state_version, now + ttl, result)
+            return dict(result)
+
+        return wrapper
+    return decorator
+
+
+@_tool
+@_ttl_cache(_JOB_READ_TTL)
 def get_job_status(job_id: str) -> dict:
     """
     Get the status of a submitted job.
@@ -48,7 +141,8 @@ def get_job_status(job_id: str) -> dict:
     return job_manager.get_job_status(job_id)
 
 
-@mcp.tool()
+@_tool
+@_ttl_cache(_JOB_READ_TTL)
 def get_job_result(job_id: str) -> dict:
     """
     Get the results of a completed job.
@@ -62,7 +156,8 @@ def get_job_result(job_id: str) -> dict:
     return job_manager.get_job_result(job_id)
 
 
-@mcp.tool()
+@_tool
+@_ttl_cache(_JOB_READ_TTL)
 def get_job_log(job_id: str, tail: int = 50) -> dict:
     """
     Get log output from a running or completed job.
@@ -77,7 +172,7 @@ def get_job_log(job_id: str, tail: int = 50) -> dict:
     return job_manager.get_job_log(job_id, tail)
 
 
-@mcp.tool()
+@_tool
 def cancel_job(job_id: str) -> dict:
     """
     Cancel a running job.
@@ -88,27 +183,42 @@ def cancel_job(job_id: str) -> dict:
     Returns:
         Success or error message
     """
-    return job_manager.cancel_job(job_id)
+    result = job_manager.cancel_job(job_id)
+    _bump_job_state()
+    return result
 
 
-@mcp.tool()
-def list_jobs(status: Optional[str] = None) -> dict:
+@_tool
+@_ttl_cache(_JOB_READ_TTL)
+def list_jobs(status: Optional[str] = None, limit: int = 50, offset: int = 0) -> dict:
     """
     List all submitted jobs.
 
     Args:
         status: Filter by status (pending, running, completed, failed, cancelled)
+        limit: Maximum number of jobs to return
+        offset: Number of jobs to skip before the first one returned
 
     Returns:
         List of jobs with their status
     """
-    return job_manager.list_jobs(status)
+    if limit < 1 or offset < 0:
+        return {"status": "error", "error": "limit must be positive and offset non-negative"}
+    result = job_manager.list_jobs(status)
+    jobs = result.get("jobs")
+    if isinstance(jobs, list):
+        result = {
+            **result,
+            "jobs": jobs[offset:offset + limit],
+            "has_more": len(jobs) > offset + limit,
+        }
+    return result
 
 # ==============================================================================
 # Synchronous Tools (for fast operations < 10 min)
 # ==============================================================================
 
-@mcp.tool()
+@_tool
 def simple_design(
     input_file: str,
     chains: Optional[str] = None,
@@ -131,8 +241,6 @@ def simple_design(
     Returns:
         Dictionary with generated sequences and metadata
     """
-    from protein_design import run_protein_design
-
     try:
         result = run_protein_design(
             input_file=input_file,
@@ -152,7 +260,7 @@ def simple_design(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@_tool
 def sequence_scoring(
     input_file: str,
     fasta_sequences: Optional[str] = None,
@@ -173,18 +281,12 @@ def sequence_scoring(
     Returns:
         Dictionary with sequence scores and analysis
     """
-    from sequence_scoring import run_sequence_scoring
-
     try:
-        # Parse sequences if provided
-        sequences = None
-        if fasta_sequences:
-            sequences = [seq.strip() for seq in fasta_sequences.split("/") if seq.strip()]
-
+        # run_sequence_scoring splits the "/"-separated string itself
         result = run_sequence_scoring(
             input_file=input_file,
             output_file=output_dir,
-            sequences=sequences,
+            sequences=fasta_sequences or None,
             save_probs=save_probs
         )
         return {"status": "success", **result}
@@ -198,7 +300,7 @@ def sequence_scoring(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@_tool
 def constrained_design(
     input_file: str,
     chains_to_design: Optional[str] = None,
@@ -221,8 +323,6 @@ def constrained_design(
     Returns:
         Dictionary with constrained sequences and metadata
     """
-    from constrained_design import run_constrained_design
-
     try:
         # Parse fixed positions
         fixed_residues = None
@@ -250,7 +350,7 @@ def constrained_design(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@_tool
 def ca_only_design(
     input_file: str,
     chains: Optional[str] = None,
@@ -273,8 +373,6 @@ def ca_only_design(
     Returns:
         Dictionary with CA-designed sequences and metadata
     """
-    from protein_design import run_protein_design
-
     try:
         # Configure for CA-only design
         ca_config = {
@@ -303,7 +401,7 @@ def ca_only_design(
 # Submit Tools (for long-running operations > 10 min)
 # ==============================================================================
 
-@mcp.tool()
+@_tool
 def submit_batch_design(
     input_dir: str,
     file_pattern: str = "*.pdb",
@@ -331,23 +429,27 @@ def submit_batch_design(
         - get_job_result(job_id) to get results
         - get_job_log(job_id) to see logs
     """
-    # Create a batch script that processes multiple files
-    script_path = str(SCRIPTS_DIR / "protein_design.py")
-
     # Find files matching pattern
     input_path = Path(input_dir)
     if not input_path.exists():
         return {"status": "error", "error": f"Input directory not found: {input_dir}"}
 
-    files = list(input_path.glob(file_pattern))
+    if "/" in file_pattern or "**" in file_pattern:
+        # Patterns that reach into subdirectories still need a real glob
+        files = [str(f) for f in input_path.glob(file_pattern)]
+    else:
+        # Single-level pattern: match names from one directory listing, no per-file stat.
+        # Like Path.glob, this includes dotfiles and directories that match.
+        with os.scandir(input_path) as entries:
+            files = [entry.path for entry in entries if fnmatch.fnmatch(entry.name, file_pattern)]
     if not files:
         return {"status": "error", "error": f"No files matching pattern '{file_pattern}' in {input_dir}"}
 
     # Convert file list to comma-separated string for batch processing
-    input_files = ",".join(str(f) for f in files)
+    input_files = ",".join(files)
 
-    return job_manager.submit_job(
-        script_path=script_path,
+    result = job_manager.submit_job(
+        script_path=_PROTEIN_DESIGN_SCRIPT,
         args={
             "input": input_files,
             "num_sequences": num_sequences,
@@ -356,9 +458,11 @@ def submit_batch_design(
         },
         job_name=job_name or f"batch_{len(files)}_files"
     )
+    _bump_job_state()
+    return result
 
 
-@mcp.tool()
+@_tool
 def submit_large_design(
     input_file: str,
     chains: Optional[str] = None,
@@ -383,10 +487,8 @@ def submit_large_design(
     Returns:
         Dictionary with job_id for tracking the design job
     """
-    script_path = str(SCRIPTS_DIR / "protein_design.py")
-
-    return job_manager.submit_job(
-        script_path=script_path,
+    result = job_manager.submit_job(
+        script_path=_PROTEIN_DESIGN_SCRIPT,
         args={
             "input": input_file,
             "chains": chains,
@@ -396,12 +498,23 @@ def submit_large_design(
         },
         job_name=job_name or f"large_design_{num_sequences}_seqs"
     )
+    _bump_job_state()
+    return result
 
 # ==============================================================================
 # Validation and Utility Tools
 # ==============================================================================
 
-@mcp.tool()
+# (path, mtime_ns, size) -> parsed structure info, least recently used first
+_validate_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+_VALIDATE_CACHE_SIZE = 64
+
+# path -> monotonic time it was last found missing; answered from here for a short TTL
+_missing_files: Dict[str, float] = {}
+_MISSING_FILE_TTL = 1.0
+
+
+@_tool
 def validate_pdb_structure(input_file: str) -> dict:
     """
     Validate a PDB structure for ProteinMPNN compatibility.
@@ -414,17 +527,31 @@ def validate_pdb_structure(input_file: str) -> dict:
     Returns:
         Dictionary with validation results and structure info
     """
-    from lib.validation import validate_pdb_file
-    from lib.io import load_structure_info
+    now = time.monotonic()
+    missing_since = _missing_files.get(input_file)
+    if missing_since is not None and now - missing_since < _MISSING_FILE_TTL:
+        return {"status": "error", "error": f"File not found: {input_file}", "valid": False}
 
     try:
-        # Basic file validation
-        validate_pdb_file(Path(input_file))
-
-        # Get structure information
-        info = load_structure_info(Path(input_file))
-
-        return {
+        # Basic file validation (one stat, reused for the cache key)
+        st = validate_pdb_file(input_file)
+        _missing_files.pop(input_file, None)
+
+        # Reuse the parsed info while the file is unchanged; every call gets
+        # its own copy so callers cannot alter later answers
+        key = (input_file, st.st_mtime_ns, st.st_size)
+        cached = _validate_cache.get(key)
+        if cached is not None:
+            _validate_cache.move_to_end(key)
+        else:
+            # Get structure information
+            cached = load_structure_info(input_file)
+            _validate_cache[key] = cached
+            if len(_validate_cache) > _VALIDATE_CACHE_SIZE:
+                _validate_cache.popitem(last=False)
+        info = copy.deepcopy(cached)
+
+        result = {
             "status": "success",
             "file_path": input_file,
             "valid": True,
@@ -433,7 +560,12 @@ def validate_pdb_structure(input_file: str) -> dict:
             "has_ligands": info.get("has_ligands", False),
             "structure_info": info
         }
+        return result
     except FileNotFoundError:
+        if len(_missing_files) >= _VALIDATE_CACHE_SIZE:
+            for path in [p for p, t in _missing_files.items() if now - t >= _MISSING_FILE_TTL]:
+                del _missing_files[path]
+        _missing_files[input_file] = now
         return {"status": "error", "error": f"File not found: {input_file}", "valid": False}
     except ValueError as e:
         return {"status": "error", "error": f"Invalid PDB file: {e}", "valid": False}
@@ -441,39 +573,86 @@ def validate_pdb_structure(input_file: str) -> dict:
         return {"status": "error", "error": f"Validation failed: {e}", "valid": False}
 
 
-@mcp.tool()
-def list_example_structures() -> dict:
+# Example PDB path -> ((mtime_ns, size), parsed info or None if parsing failed)
+_structure_info_cache: Dict[str, tuple] = {}
+
+# Parse uncached example structures in a thread pool once there are this many
+_PARALLEL_PARSE_MIN = 8
+
+
+def _safe_load_structure_info(pdb_path: str) -> Optional[dict]:
+    """Parse one structure, returning None instead of raising."""
+    try:
+        return load_structure_info(pdb_path)
+    except Exception:
+        return None
+
+
+@_tool
+def list_example_structures(limit: int = 50, offset: int = 0) -> dict:
     """
     List available example PDB structures for testing.
 
     Returns paths to example structures included with ProteinMPNN.
 
+    Args:
+        limit: Maximum number of structures to return
+        offset: Number of structures to skip before the first one returned
+
     Returns:
         Dictionary with example structure paths and descriptions
     """
+    if limit < 1 or offset < 0:
+        return {"status": "error", "error": "limit must be positive and offset non-negative"}
     examples_dir = MCP_ROOT / "examples" / "data"
 
     if not examples_dir.exists():
         return {"status": "error", "error": "Examples directory not found"}
 
+    # (path, name) of each example, plus the ones whose cached info is stale
+    pdb_entries = []
+    stale = {}
+    with os.scandir(examples_dir) as entries:
+        pdb_files = [entry for entry in entries if entry.name.endswith(".pdb")]
+    # Sorted by name so pages are stable across calls; only the page is statted and parsed
+    pdb_files.sort(key=lambda entry: entry.name)
+    total = len(pdb_files)
+    has_more = offset + limit < total
+    for entry in pdb_files[offset:offset + limit]:
+        pdb_entries.append((entry.path, entry.name))
+        st = entry.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        # Reuse the parsed info while the file is unchanged
+        cached = _structure_info_cache.get(entry.path)
+        if cached is None or cached[0] != stamp:
+            stale[entry.path] = stamp
+
+    # Try to get basic info about each changed structure
+    if len(stale) >= _PARALLEL_PARSE_MIN:
+        with ThreadPoolExecutor(max_workers=min(8, len(stale))) as pool:
+            parsed = pool.map(_safe_load_structure_info, stale)
+    else:
+        parsed = map(_safe_load_structure_info, stale)
+    for (path, stamp), info in zip(stale.items(), parsed):
+        _structure_info_cache[path] = (stamp, info)
+
     structures = []
-    for pdb_file in examples_dir.glob("*.pdb"):
-        # Try to get basic info about each structure
-        try:
-            from lib.io import load_structure_info
-            info = load_structure_info(pdb_file)
+    for path, name in pdb_entries:
+        info = _structure_info_cache[path][1]
+        if info is not None:
             structures.append({
-                "path": str(pdb_file),
-                "name": pdb_file.name,
+                "path": path,
+                "name": name,
                 "chains": info.get("chains", []),
                 "num_residues": info.get("num_residues", 0),
                 "has_ligands": info.get("has_ligands", False)
             })
-        except:
+        else:
             # Basic fallback info if parsing fails
             structures.append({
-                "path": str(pdb_file),
-                "name": pdb_file.name,
+                "path": path,
+                "name": name,
                 "chains": "unknown",
                 "num_residues": 0,
                 "has_ligands": False
@@ -483,7 +662,8 @@ def list_example_structures() -> dict:
         "status": "success",
         "examples_dir": str(examples_dir),
         "structures": structures,
-        "total_structures": len(structures)
+        "total_structures": total,
+        "has_more": has_more
     }
 
 # ==============================================================================
@@ -491,4 +671,4 @@ def list_example_structures() -> dict:
 # ==============================================================================
 
 if __name__ == "__main__":
-    mcp.run()
\ No newline at end of file
+    _get_mcp().run()
\ No newline at end of file
@@ -1,136 +1,237 @@
 #!/usr/bin/env python3
-"""Test actual tool functionality with simple direct calls."""
+"""Test actual tool functionality with simple direct calls.
 
+Run with pytest (e.g. ``pytest -n 4 test_tool_functionality.py``).
+"""
+
+import atexit
+import functools
+import importlib
+import importlib.util
+import os
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
+
 # Add paths
 SCRIPT_DIR = Path(__file__).parent.resolve()
-sys.path.insert(0, str(SCRIPT_DIR / "src"))
-sys.path.insert(0, str(SCRIPT_DIR / "scripts"))
+for _path in (str(SCRIPT_DIR / "src"), str(SCRIPT_DIR / "scripts"), str(SCRIPT_DIR / "examples")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+EXAMPLES_DIR = (SCRIPT_DIR / "examples" / "data").resolve()
+
+@functools.lru_cache(maxsize=1)
+def _pdb_files(examples_dir: str) -> tuple:
+    """Paths of the *.pdb files in examples_dir, listed once per run."""
+    with os.scandir(examples_dir) as entries:
+        return tuple(
+            entry.path for entry in entries
+            if entry.name.endswith(".pdb") and entry.is_file(follow_symlinks=False)
+        )
+
+_DUMMY_SCRIPT_SRC = '''print("done")
+'''
+_LONG_SCRIPT_SRC = '''import time
+time.sleep(2)
+print("done")
+'''
+
+# Set RUN_SLOW_TESTS=1 to also run tests that wait on real job runtime
+RUN_SLOW_TESTS = os.environ.get("RUN_SLOW_TESTS") == "1"
+
+@functools.lru_cache(maxsize=None)
+def _dummy_script_path(source: str = _DUMMY_SCRIPT_SRC) -> str:
+    """Write a dummy job script to a temp file once; removed at exit."""
+    fd, path = tempfile.mkstemp(suffix=".py")
+    with os.fdopen(fd, "w") as f:
+        f.write(source)
+    atexit.register(os.unlink, path)
+    return path
+
+_TERMINAL_JOB_STATES = frozenset({"completed", "failed", "cancelled", "error"})
+_BATCH_JOBS = 32
+
+def _wait_all(job_manager, job_ids, timeout: float = 10.0) -> dict:
+    """
+    Wait for every job under one shared deadline; returns job_id -> status.
+
+    Uses job_manager.wait_all when the manager provides one. Otherwise the
+    manager exposes no completion hook or child pids, so pending jobs are
+    polled with a short backoff.
+
+    Raises:
+        TimeoutError: If any job is still unfinished at the deadline
+    """
+    wait_all = getattr(job_manager, "wait_all", None)
+    if wait_all is not None:
+        return wait_all(job_ids, timeout=timeout)
+
+    deadline = time.monotonic() + timeout
+    interval = 0.01
+    statuses = {}
+    pending = list(job_ids)
+    while True:
+        still_pending = []
+        for job_id in pending:
+            status = job_manager.get_job_status(job_id)
+            statuses[job_id] = status
+            if status.get("status") not in _TERMINAL_JOB_STATES:
+                still_pending.append(job_id)
+        pending = still_pending
+        if not pending:
+            return statuses
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"{len(pending)} of {len(statuses)} jobs unfinished after {timeout}s")
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, 0.2)
 
 def test_list_examples_direct():
     """Test list_example_structures by calling the implementation directly."""
-    print("Testing list_example_structures implementation...")
+    # Import the server module to access paths
+    import server
 
-    try:
-        # Import the server module to access paths
-        import server
-
-        # Get the examples directory
-        examples_dir = server.MCP_ROOT / "examples" / "data"
-
-        if not examples_dir.exists():
-            print(f"❌ Examples directory not found: {examples_dir}")
-            return False
-
-        structures = []
-        for pdb_file in examples_dir.glob("*.pdb"):
-            structures.append({
-                "path": str(pdb_file),
-                "name": pdb_file.name,
-            })
-
-        if len(structures) > 0:
-            print(f"✅ Found {len(structures)} example structures")
-            for structure in structures:
-                print(f"   - {structure['name']}")
-            return True
-        else:
-            print("❌ No structures found")
-            return False
+    # The server must look in the same examples directory as the tests
+    assert EXAMPLES_DIR == (server.MCP_ROOT / "examples" / "data").resolve()
+    assert EXAMPLES_DIR.exists(), f"Examples directory not found: {EXAMPLES_DIR}"
 
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        return False
+    structures = [
+        {"path": path, "name": os.path.basename(path)}
+        for path in _pdb_files(str(EXAMPLES_DIR))
+    ]
+    assert structures, "No structures found"
 
 def test_validation_direct():
     """Test validation functionality directly."""
-    print("Testing validation implementation...")
-
-    try:
-        # Test with an example file
-        examples_dir = SCRIPT_DIR / "examples" / "data"
-        pdb_files = list(examples_dir.glob("*.pdb"))
-
-        if not pdb_files:
-            print("❌ No PDB files found for testing")
-            return False
+    # Test with an example file
+    pdb_files = _pdb_files(str(EXAMPLES_DIR))
+    assert pdb_files, "No PDB files found for testing"
 
-        test_file = pdb_files[0]
-        print(f"Testing with file: {test_file.name}")
+    test_file = pdb_files[0]
 
-        # Simple validation - check if file exists and has content
-        if test_file.exists() and test_file.stat().st_size > 0:
-            print(f"✅ File {test_file.name} exists and has content ({test_file.stat().st_size} bytes)")
-            return True
-        else:
-            print(f"❌ File validation failed")
-            return False
-
-    except Exception as e:
-        print(f"❌ Validation test failed: {e}")
-        return False
+    # Simple validation - check if file exists and has content; the one
+    # stat answers both, a missing file reading as empty
+    try:
+        size = os.path.getsize(test_file)
+    except FileNotFoundError:
+        size = 0
+    assert size > 0, f"File validation failed: {os.path.basename(test_file)}"
 
 def test_job_manager_workflow():
     """Test the job manager workflow."""
-    print("Testing job manager workflow...")
+    from jobs.manager import job_manager
 
-    try:
-        from jobs.manager import job_manager
-
-        # Test 1: List jobs (should be empty)
-        result = job_manager.list_jobs()
-        if result.get("status") == "success":
-            print(f"✅ Initial job list: {result['total']} jobs")
-        else:
-            print(f"❌ Failed to list jobs: {result}")
-            return False
-
-        # Test 2: Submit a test job (this will fail but we can test the submission process)
-        # Create a simple test script
-        test_script = SCRIPT_DIR / "test_dummy_script.py"
-        test_script.write_text('''#!/usr/bin/env python3
-import sys
-import time
-print("Test job starting...")
-time.sleep(1)
-print("Test job completed!")
-''')
+    # Test 1: List jobs
+    result = job_manager.list_jobs()
+    assert result.get("status") == "success", f"Failed to list jobs: {result}"
 
-        result = job_manager.submit_job(
-            script_path=str(test_script),
+    # Test 2: Submit a batch so the manager is exercised with concurrent jobs
+    test_script = _dummy_script_path()
+    results = [
+        job_manager.submit_job(
+            script_path=test_script,
             args={},
-            job_name="test_job"
+            job_name=f"test_job_{i}"
         )
-
-        if result.get("status") == "submitted":
-            job_id = result.get("job_id")
-            print(f"✅ Job submitted successfully with ID: {job_id}")
-
-            # Wait a moment and check status
-            import time
-            time.sleep(2)
-
-            status = job_manager.get_job_status(job_id)
-            print(f"✅ Job status retrieved: {status.get('status', 'unknown')}")
-
-            # Clean up
-            test_script.unlink()
-
-            return True
-        else:
-            print(f"❌ Failed to submit job: {result}")
-            return False
-
+        for i in range(_BATCH_JOBS)
+    ]
+    failed = [result for result in results if result.get("status") != "submitted"]
+    assert not failed, f"Failed to submit job: {failed[0] if failed else None}"
+
+    # Wait for the whole batch and check status
+    job_ids = [result.get("job_id") for result in results]
+    statuses = _wait_all(job_manager, job_ids, timeout=10)
+    not_completed = {
+        job_id: status.get("status")
+        for job_id, status in statuses.items()
+        if status.get("status") != "completed"
+    }
+    assert not not_completed, f"Jobs did not complete: {not_completed}"
+
+@pytest.mark.skipif(not RUN_SLOW_TESTS, reason="set RUN_SLOW_TESTS=1 to run")
+def test_long_running_job():
+    """Test that waiting on a job stops at the timeout while it still runs."""
+    from jobs.manager import job_manager
+
+    result = job_manager.submit_job(
+        script_path=_dummy_script_path(_LONG_SCRIPT_SRC),
+        args={},
+        job_name="test_long_job"
+    )
+    assert result.get("status") == "submitted", f"Failed to submit job: {result}"
+
+    job_id = result.get("job_id")
+    with pytest.raises(TimeoutError):
+        _wait_all(job_manager, [job_id], timeout=0.5)
+
+    status = _wait_all(job_manager, [job_id], timeout=10)[job_id]
+    assert status.get("status") in _TERMINAL_JOB_STATES
+
+def test_compile_failure_falls_back_to_eager(monkeypatch):
+    """Test that a decoder whose compile fails on first use still runs eagerly."""
+    torch = pytest.importorskip("torch")
+    if not hasattr(torch, "compile") or not torch._dynamo.is_dynamo_supported():
+        pytest.skip("torch.compile is not supported here")
+    from _mpnn_runtime import cuda_graph_decoder
+
+    def failing_backend(graph_module, example_inputs):
+        raise RuntimeError("forced compile failure")
+
+    # torch.compile is lazy, so the backend only fails on the first forward
+    real_compile = torch.compile
+    monkeypatch.setattr(torch, "compile", lambda fn, **kwargs: real_compile(fn, backend=failing_backend))
+    monkeypatch.setattr(torch.cuda, "is_available", lambda: True)
+
+    class Decoder(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.decoder_layers = torch.nn.ModuleList(torch.nn.Linear(4, 4) for _ in range(2))
+
+        def forward(self, x):
+            for layer in self.decoder_layers:
+                x = layer(x)
+            return x
+
+    class RepoModule:
+        ProteinMPNN = Decoder
+
+    with cuda_graph_decoder(RepoModule):
+        model = RepoModule.ProteinMPNN()
+    assert all(layer._mpnn_compiled for layer in model.decoder_layers)
+
+    x = torch.randn(3, 4)
+    expected = x
+    for layer in model.decoder_layers:
+        expected = torch.nn.functional.linear(expected, layer.weight, layer.bias)
+
+    with torch.no_grad():
+        result = model(x)
+    torch.testing.assert_close(result, expected)
+    assert not any(layer._mpnn_compiled for layer in model.decoder_layers)
+    assert all("forward" not in vars(layer) for layer in model.decoder_layers)
+
+# Set FULL_IMPORT_CHECK=1 to execute the scripts rather than only locate them
+FULL_IMPORT_CHECK = os.environ.get("FULL_IMPORT_CHECK") == "1"
+_SCRIPT_DEPENDENCIES = ("torch", "numpy")
+_LOCAL_PACKAGES = frozenset({
+    "lib", "protein_design", "ligand_design", "sequence_scoring", "constrained_design",
+})
+
+def _try_import(name: str):
+    """Import a module; returns the exception on failure, else None."""
+    try:
+        importlib.import_module(name)
     except Exception as e:
-        print(f"❌ Job manager test failed: {e}")
-        return False
+        return e
+    return None
 
 def test_script_imports():
     """Test that we can import the main scripts."""
-    print("Testing script imports...")
-
     scripts_to_test = [
         "protein_design",
         "ligand_design",
@@ -138,40 +239,41 @@ def test_script_imports():
         "constrained_design"
     ]
 
-    imported = 0
-    for script in scripts_to_test:
-        try:
-            __import__(script)
-            print(f"✅ {script}.py imported successfully")
-            imported += 1
-        except Exception as e:
-            print(f"❌ Failed to import {script}.py: {e}")
-
-    return imported == len(scripts_to_test)
-
-if __name__ == "__main__":
-    print("=== Testing MCP Server Tool Functionality ===\n")
-
-    tests = [
-        ("Script Imports", test_script_imports),
-        ("List Examples Direct", test_list_examples_direct),
-        ("Validation Direct", test_validation_direct),
-        ("Job Manager Workflow", test_job_manager_workflow),
+    if not FULL_IMPORT_CHECK:
+        missing = [
+            script for script in scripts_to_test
+            if importlib.util.find_spec(script) is None
+        ]
+        assert not missing, f"Scripts not importable: {', '.join(missing)}"
+        return
+
+    # Without the model dependencies every script fails the same way
+    missing_deps = [
+        dep for dep in _SCRIPT_DEPENDENCIES
+        if importlib.util.find_spec(dep) is None
     ]
+    if missing_deps:
+        pytest.skip(f"missing {', '.join(missing_deps)}")
 
-    passed = 0
-    for name, test_func in tests:
-        print(f"--- {name} ---")
-        try:
-            if test_func():
-                passed += 1
-            print()  # Empty line for readability
-        except Exception as e:
-            print(f"❌ {name}: UNEXPECTED ERROR - {e}\n")
-
-    print(f"=== Results: {passed}/{len(tests)} tests passed ===")
-
-    if passed == len(tests):
-        print("🎉 All functionality tests passed! Server tools are working.")
+    # The scripts are independent, so their import I/O can overlap
+    if sys.flags.isolated:
+        errors = list(map(_try_import, scripts_to_test))
     else:
-        print("⚠️ Some functionality tests failed. Check the errors above.")
\ No newline at end of file
+        with ThreadPoolExecutor(max_workers=len(scripts_to_test)) as pool:
+            errors = list(pool.map(_try_import, scripts_to_test))
+
+    failures = {
+        script: error
+        for script, error in zip(scripts_to_test, errors)
+        if error is not None
+    }
+    # A missing third-party module is the environment, not a broken script
+    missing_external = sorted({
+        error.name for error in failures.values()
+        if isinstance(error, ModuleNotFoundError)
+        and error.name
+        and error.name.partition(".")[0] not in _LOCAL_PACKAGES
+    })
+    if missing_external:
+        pytest.skip(f"missing {', '.join(missing_external)}")
+    assert not failures, f"Failed to import: {failures}"